@@ -2,17 +2,18 @@
 Gap analysis for translation files - identifies missing translations.
 """
 
-from typing import Dict, Set, List
+from collections import Counter, defaultdict
+from typing import Dict, List, Mapping, Optional, Set, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TranslationGap:
-    """Represents a missing translation."""
+    """Represents a missing translation (immutable; shared between cached results)."""
 
     key: str
-    missing_in: List[str]  # Locales where this key is missing
-    present_in: List[str]  # Locales where this key exists
+    missing_in: Tuple[str, ...]  # Locales where this key is missing
+    present_in: Tuple[str, ...]  # Locales where this key exists
 
 
 class TranslationGapAnalyzer:
@@ -29,29 +30,39 @@ class TranslationGapAnalyzer:
         Returns:
             Dictionary of gaps keyed by translation key
         """
-        gaps = {}
-        all_keys: Set[str] = set()
-
-        # Collect all keys from all locales
+        # Single pass: remember which locales each key lives in
+        presence: Dict[str, Set[str]] = defaultdict(set)
         for locale, data in locale_data.items():
-            all_keys.update(data.keys())
+            for key in data:
+                presence[key].add(locale)
 
-        # Find which locales have each key
-        for key in all_keys:
-            present_in = []
-            missing_in = []
+        return TranslationGapAnalyzer.analyze_presence(presence, list(locale_data))
 
-            for locale, data in locale_data.items():
-                if key in data:
-                    present_in.append(locale)
-                else:
-                    missing_in.append(locale)
+    @staticmethod
+    def analyze_presence(
+        presence: Mapping[str, Set[str]],
+        locales: List[str],
+    ) -> Dict[str, TranslationGap]:
+        """
+        Analyze gaps from a precomputed key -> locales index.
 
-            if missing_in:  # Only record if there's a gap
+        Args:
+            presence: {key: set of locales containing the key, ...}
+            locales: All locale names, in display order
+
+        Returns:
+            Dictionary of gaps keyed by translation key
+        """
+        total = len(locales)
+        gaps = {}
+
+        # A key is complete iff it appears in every locale
+        for key, present in presence.items():
+            if len(present) < total:
                 gaps[key] = TranslationGap(
                     key=key,
-                    missing_in=missing_in,
-                    present_in=present_in,
+                    missing_in=tuple(loc for loc in locales if loc not in present),
+                    present_in=tuple(loc for loc in locales if loc in present),
                 )
 
         return gaps
@@ -60,23 +71,32 @@ class TranslationGapAnalyzer:
     def get_missing_keys_for_locale(
         locale_data: Dict[str, Dict],
         locale: str,
+        gaps: Optional[Dict[str, TranslationGap]] = None,
     ) -> List[str]:
         """Get all keys missing in a specific locale."""
-        gaps = TranslationGapAnalyzer.analyze(locale_data)
+        if gaps is None:
+            gaps = TranslationGapAnalyzer.analyze(locale_data)
         return [key for key, gap in gaps.items() if locale in gap.missing_in]
 
     @staticmethod
-    def get_complete_keys(locale_data: Dict[str, Dict]) -> List[str]:
+    def get_complete_keys(
+        locale_data: Dict[str, Dict],
+        gaps: Optional[Dict[str, TranslationGap]] = None,
+    ) -> List[str]:
         """Get keys that exist in all locales."""
-        gaps = TranslationGapAnalyzer.analyze(locale_data)
+        if gaps is None:
+            gaps = TranslationGapAnalyzer.analyze(locale_data)
         all_keys = set()
         for data in locale_data.values():
             all_keys.update(data.keys())
 
-        return [key for key in all_keys if key not in gaps]
+        return list(all_keys.difference(gaps))
 
     @staticmethod
-    def get_coverage_percentage(locale_data: Dict[str, Dict]) -> Dict[str, float]:
+    def get_coverage_percentage(
+        locale_data: Dict[str, Dict],
+        gaps: Optional[Dict[str, TranslationGap]] = None,
+    ) -> Dict[str, float]:
         """Get translation coverage percentage per locale."""
         all_keys = set()
         for data in locale_data.values():
@@ -85,9 +105,15 @@ class TranslationGapAnalyzer:
         if not all_keys:
             return {}
 
-        coverage = {}
-        for locale, data in locale_data.items():
-            present = len([k for k in all_keys if k in data])
-            coverage[locale] = (present / len(all_keys)) * 100
+        if gaps is None:
+            gaps = TranslationGapAnalyzer.analyze(locale_data)
+
+        # Count missing keys per locale from the gap list
+        missing: Counter = Counter()
+        for gap in gaps.values():
+            missing.update(gap.missing_in)
 
-        return coverage
+        total = len(all_keys)
+        return {
+            locale: ((total - missing[locale]) / total) * 100 for locale in locale_data
+        }
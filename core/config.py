@@ -5,9 +5,12 @@ Supports both global and local (project-specific) configuration.
 
 from pathlib import Path
 from typing import Any, Optional
-import tomli
+import tomllib
 import tomli_w
 
+# Cached marker for keys that are not set
+_MISSING = object()
+
 
 class Config:
     """Manages lazyi18n configuration."""
@@ -21,6 +24,7 @@ class Config:
         """
         self.project_dir = Path(project_dir) if project_dir else None
         self._config = {}
+        self._resolved: dict = {}
         self._load()
 
     @staticmethod
@@ -39,13 +43,14 @@ class Config:
     def _load(self) -> None:
         """Load configuration from global and local files."""
         self._config = {}
+        self._resolved = {}
 
         # Load global config
         global_path = self.get_global_config_path()
         if global_path.exists():
             try:
                 with open(global_path, "rb") as f:
-                    self._config.update(tomli.load(f))
+                    self._config.update(tomllib.load(f))
             except Exception as e:
                 print(f"Warning: Failed to load global config: {e}")
 
@@ -54,7 +59,7 @@ class Config:
         if local_path and local_path.exists():
             try:
                 with open(local_path, "rb") as f:
-                    self._config.update(tomli.load(f))
+                    self._config.update(tomllib.load(f))
             except Exception as e:
                 print(f"Warning: Failed to load local config: {e}")
 
@@ -69,6 +74,10 @@ class Config:
         Returns:
             Configuration value or default
         """
+        if key in self._resolved:
+            value = self._resolved[key]
+            return default if value is _MISSING else value
+
         parts = key.split(".")
         value = self._config
 
@@ -76,9 +85,11 @@ class Config:
             if isinstance(value, dict) and part in value:
                 value = value[part]
             else:
-                return default
+                value = _MISSING
+                break
 
-        return value
+        self._resolved[key] = value
+        return default if value is _MISSING else value
 
     def set(self, key: str, value: Any, local: bool = False) -> bool:
         """
@@ -93,6 +104,7 @@ class Config:
             True if successful
         """
         # Update in-memory config
+        self._resolved.clear()
         parts = key.split(".")
         config_dict = self._config
 
@@ -166,6 +178,7 @@ class Config:
         # Delete key
         if parts[-1] in config_dict:
             del config_dict[parts[-1]]
+            self._resolved.clear()
             return self._save(local)
 
         return False
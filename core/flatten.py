@@ -3,8 +3,12 @@ Utilities for flattening/unflattening nested i18n JSON structures.
 Converts between nested dicts and dot-notation for easier comparison.
 """
 
+import sys
 from typing import Dict, Any
 
+# Sentinel for lookups that must tell "absent" apart from a stored None
+_MISSING = object()
+
 
 def flatten_json(
     data: Dict,
@@ -18,17 +22,28 @@ def flatten_json(
         {"auth": {"login": {"btn": "Login"}}}
         -> {"auth.login.btn": "Login"}
     """
-    items = []
-
-    for key, value in data.items():
-        new_key = f"{parent_key}{sep}{key}" if parent_key else key
-
-        if isinstance(value, dict):
-            items.extend(flatten_json(value, new_key, sep=sep).items())
+    result = {}
+    # Stack of (prefix, iterator) pairs; each prefix already ends with the
+    # separator so it is built once per subtree and shared by its leaves.
+    # Iterators keep document key order.
+    stack = [(parent_key + sep if parent_key else "", iter(data.items()))]
+
+    while stack:
+        prefix, entries = stack[-1]
+        for key, value in entries:
+            new_key = prefix + key
+
+            if isinstance(value, dict):
+                # Descend first, then resume this level where we left off
+                stack.append((new_key + sep, iter(value.items())))
+                break
+            # Every locale repeats the same keys; interning lets them share
+            # one string, and lookups across locales hit on identity
+            result[sys.intern(new_key)] = value
         else:
-            items.append((new_key, value))
+            stack.pop()
 
-    return dict(items)
+    return result
 
 
 def unflatten_json(
@@ -41,32 +56,58 @@ def unflatten_json(
     Example:
         {"auth.login.btn": "Login"}
         -> {"auth": {"login": {"btn": "Login"}}}
+
+    Raises:
+        ValueError: If a key is both a value and a parent of other keys
+            (e.g. "auth" and "auth.login")
     """
     result = {}
+    # Containers created so far, keyed by their dotted prefix. Sibling keys
+    # share a prefix, so most entries find their parent with one lookup
+    # instead of walking down from the root. A value is never stored over a
+    # container (or a container over a value), so cached ones stay attached.
+    containers: Dict[str, Dict] = {}
 
     for key, value in data.items():
-        parts = key.split(sep)
-        current = result
-
-        for part in parts[:-1]:
-            if part not in current:
-                current[part] = {}
-            current = current[part]
-
-        current[parts[-1]] = value
+        if key in containers:
+            raise ValueError(f"Key conflict: {key!r} is also a parent of other keys")
+
+        prefix, found, leaf = key.rpartition(sep)
+        if not found:
+            result[key] = value
+            continue
+
+        parent = containers.get(prefix)
+        if parent is None:
+            parent = result
+            path = None
+            for part in prefix.split(sep):
+                path = part if path is None else f"{path}{sep}{part}"
+                node = containers.get(path)
+                if node is None:
+                    node = parent.setdefault(part, {})
+                    if not isinstance(node, dict):
+                        raise ValueError(
+                            f"Key conflict: {key!r} is nested under the value {path!r}"
+                        )
+                    containers[path] = node
+                parent = node
+
+        parent[leaf] = value
 
     return result
 
 
 def get_nested_value(data: Dict, key: str, sep: str = ".") -> Any:
     """Get a value from nested dict using dot-notation key."""
-    parts = key.split(sep)
     current = data
 
-    for part in parts:
-        if isinstance(current, dict) and part in current:
-            current = current[part]
-        else:
+    for part in key.split(sep):
+        if not isinstance(current, dict):
+            return None
+        # Single lookup per level; the sentinel distinguishes stored None
+        current = current.get(part, _MISSING)
+        if current is _MISSING:
             return None
 
     return current
@@ -0,0 +1,46 @@
+"""
+JSON helpers - use orjson when installed, stdlib json otherwise.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Parse a JSON document.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+            (orjson's error type is a subclass of it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data: Any, indent: int = 2) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes (non-ASCII kept as-is) with a
+    trailing newline. Output matches json.dumps(..., ensure_ascii=False)
+    apart from float exponent formatting.
+    """
+    # orjson only supports 2-space indentation and 64-bit integers
+    if orjson is not None and indent == 2:
+        try:
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_APPEND_NEWLINE,
+            )
+        except orjson.JSONEncodeError:
+            pass
+
+    text = json.dumps(data, indent=indent, ensure_ascii=False, sort_keys=False)
+    return (text + "\n").encode("utf-8")
@@ -4,9 +4,19 @@ Supports OpenAI-compatible APIs.
 """
 
 import json
-from typing import Dict, Optional, List, Callable
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Optional, List, Callable, Tuple
 from openai import OpenAI
 
+from . import jsonio
+from .writer import TranslationWriter
+
+logger = logging.getLogger("lazyi18n.llm")
+
 
 class LLMTranslationError(Exception):
     """Raised when LLM translation fails."""
@@ -17,11 +27,25 @@ class LLMTranslationError(Exception):
 class LLMTranslator:
     """Handles translation using OpenAI-compatible LLMs."""
 
+    SYSTEM_PROMPT = (
+        "You are a professional translator for a software application. "
+        "You will receive a JSON object containing a list of items (each with a "
+        "translation key for context and the source text), the source locale and "
+        "the target locales. "
+        "You must return a JSON object where keys are the translation keys and values "
+        "are objects mapping each target locale to its translation. "
+        "Do not include any markdown formatting or explanations. Return ONLY raw JSON."
+    )
+
+    # Oldest entries are dropped once the on-disk cache grows past this
+    MAX_CACHE_ENTRIES = 10000
+
     def __init__(
         self,
         api_key: str,
         base_url: Optional[str] = None,
         model: str = "gpt-3.5-turbo",
+        cache_dir: Optional[Path] = None,
     ):
         """
         Initialize LLM translator.
@@ -30,9 +54,45 @@ class LLMTranslator:
             api_key: API key for the LLM service
             base_url: Base URL for the API (optional, defaults to OpenAI)
             model: Model to use (default: gpt-3.5-turbo)
+            cache_dir: Directory for the on-disk translation cache
+                (optional, defaults to an in-memory cache only)
         """
         self.client = OpenAI(api_key=api_key, base_url=base_url)
         self.model = model
+        self.cache_path = Path(cache_dir) / "llm.json" if cache_dir else None
+        self._cache: Optional[Dict[str, str]] = None
+
+    def _cache_key(self, source_locale: str, source_text: str, locale: str) -> str:
+        """Hash (model, source locale, source text, target locale)."""
+        raw = "\0".join((self.model, source_locale, source_text, locale))
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def _get_cache(self) -> Dict[str, str]:
+        """Get the translation cache, loading it from disk on first use."""
+        if self._cache is None:
+            self._cache = {}
+            if self.cache_path and self.cache_path.exists():
+                try:
+                    data = jsonio.loads(self.cache_path.read_bytes())
+                except (OSError, json.JSONDecodeError, UnicodeDecodeError) as e:
+                    logger.warning(
+                        "Ignoring unreadable LLM cache %s: %s", self.cache_path, e
+                    )
+                    return self._cache
+                if isinstance(data, dict):
+                    self._cache = {k: v for k, v in data.items() if isinstance(v, str)}
+        return self._cache
+
+    def _save_cache(self) -> None:
+        """Persist the translation cache to disk, dropping the oldest entries."""
+        if not self.cache_path or self._cache is None:
+            return
+        excess = len(self._cache) - self.MAX_CACHE_ENTRIES
+        if excess > 0:
+            for cache_key in list(islice(self._cache, excess)):
+                del self._cache[cache_key]
+        if not TranslationWriter().write_atomic(self._cache, self.cache_path):
+            logger.warning("Could not write LLM cache %s", self.cache_path)
 
     def translate_key(
         self,
@@ -55,6 +115,43 @@ class LLMTranslator:
         Returns:
             Dictionary mapping locale -> translated text
         """
+        results = self.translate_keys_batch(
+            [(key, source_text)],
+            source_locale,
+            target_locales,
+            log_callback=log_callback,
+        )
+        return results.get(key, {})
+
+    def translate_keys_batch(
+        self,
+        items: List[Tuple[str, str]],
+        source_locale: str,
+        target_locales: List[str],
+        log_callback: Optional[Callable[[str], None]] = None,
+        batch_size: int = 20,
+        max_workers: int = 8,
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Translate many keys to multiple target locales using LLM.
+        Keys are packed into batches of `batch_size` per request and the
+        batches are sent concurrently.
+
+        Args:
+            items: List of (key, source_text) pairs
+            source_locale: The source language
+            target_locales: List of target languages
+            log_callback: Optional callback for logging progress
+            batch_size: Maximum number of keys per request
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            Dictionary mapping key -> {locale: translated text}; keys from
+            failed batches are left out
+
+        Raises:
+            LLMTranslationError: If every request failed and nothing was cached
+        """
 
         def log(msg: str):
             if log_callback:
@@ -64,115 +161,188 @@ class LLMTranslator:
             log("[yellow]No target locales specified.[/]")
             return {}
 
-        log(f"Preparing translation for key: [bold]{key}[/]")
-        log(f"Source ({source_locale}): {source_text}")
+        if not items:
+            return {}
+
+        if len(items) == 1:
+            key, source_text = items[0]
+            log(f"Preparing translation for key: [bold]{key}[/]")
+            log(f"Source ({source_locale}): {source_text}")
+        else:
+            log(f"Preparing translation for {len(items)} keys")
+            log(f"Source locale: {source_locale}")
         log(f"Targets: {', '.join(target_locales)}")
         log(f"Model: {self.model}")
 
-        system_prompt = (
-            "You are a professional translator for a software application. "
-            "You will receive a JSON object containing the source text, source locale, "
-            "target locales, and the translation key (for context). "
-            "You must return a JSON object where keys are the target locales and values are the translations. "
-            "Do not include any markdown formatting or explanations. Return ONLY raw JSON."
-        )
-
+        # Reuse cached translations; group the rest by which locales they need
+        cache = self._get_cache()
+        results: Dict[str, Dict[str, str]] = {}
+        pending: Dict[Tuple[str, ...], List[Tuple[str, str]]] = {}
+        hits = 0
+        for key, source_text in items:
+            missing = []
+            for locale in target_locales:
+                cache_key = self._cache_key(source_locale, source_text, locale)
+                cached = cache.pop(cache_key, None)
+                if cached is None:
+                    missing.append(locale)
+                else:
+                    # Re-insert so recently used entries are trimmed last
+                    cache[cache_key] = cached
+                    results.setdefault(key, {})[locale] = cached
+                    hits += 1
+            if missing:
+                pending.setdefault(tuple(missing), []).append((key, source_text))
+
+        if hits:
+            log(f"Reused {hits} cached translation(s)")
+        if not pending:
+            return results
+
+        batches = [
+            (list(locales), group[i : i + batch_size])
+            for locales, group in pending.items()
+            for i in range(0, len(group), batch_size)
+        ]
+
+        # A failed batch only loses its own keys
+        fresh: List[Dict[str, Dict[str, str]]] = []
+        errors: List[LLMTranslationError] = []
+        if len(batches) == 1:
+            locales, batch = batches[0]
+            try:
+                fresh.append(self._translate_batch(batch, source_locale, locales, log))
+            except LLMTranslationError as e:
+                errors.append(e)
+        else:
+            log(f"Sending {len(batches)} batches ({max_workers} at a time)...")
+            workers = min(max_workers, len(batches))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(
+                        self._translate_batch, batch, source_locale, locales, log
+                    )
+                    for locales, batch in batches
+                ]
+                for future in futures:
+                    try:
+                        fresh.append(future.result())
+                    except LLMTranslationError as e:
+                        errors.append(e)
+        if errors:
+            log(f"[bold red]{len(errors)} of {len(batches)} batch(es) failed[/]")
+            if not fresh and not results:
+                raise errors[0]
+
+        # Merge fresh results and remember them for next time
+        source_texts = dict(items)
+        for batch_result in fresh:
+            for key, translations in batch_result.items():
+                results.setdefault(key, {}).update(translations)
+                for locale, text in translations.items():
+                    cache_key = self._cache_key(
+                        source_locale, source_texts[key], locale
+                    )
+                    cache[cache_key] = text
+        self._save_cache()
+
+        return results
+
+    def _translate_batch(
+        self,
+        batch: List[Tuple[str, str]],
+        source_locale: str,
+        target_locales: List[str],
+        log: Callable[[str], None],
+    ) -> Dict[str, Dict[str, str]]:
+        """Send one batch of keys to the LLM and validate the response."""
         user_content = {
-            "key": key,
             "source_locale": source_locale,
-            "source_text": source_text,
             "target_locales": target_locales,
+            "items": [
+                {"key": key, "source_text": source_text} for key, source_text in batch
+            ],
         }
 
         log("Sending request to LLM API...")
-        # log(f"System Prompt: {system_prompt}") # Too verbose? Maybe.
         log(f"User Content: {json.dumps(user_content, indent=2)}")
 
         try:
-            # Check if model is o1-mini or o1-preview which don't support response_format
-            is_o1 = self.model.startswith("o1-")
-            kwargs = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": json.dumps(user_content)},
-                ],
-            }
-
-            # Only add response_format for non-o1 models and non-claude models (if using via OpenAI compat)
-            # Claude models via some proxies might not support json_object type or require different handling
-            # But the error specifically said "Input should be 'json_schema'" which suggests a newer OpenAI client validation
-            # or a specific model requirement.
-            # However, for broad compatibility, we'll try to be safer.
-
-            # If the error is "response_format.type: Input should be 'json_schema'", it means the model/client
-            # expects structured outputs (json_schema) instead of json_object, OR the library version is enforcing it.
-            # But standard gpt-3.5/4 supports json_object.
-            # The traceback shows 'claude-sonnet-4-5' as the model.
-            # If the user is using an OpenAI-compatible endpoint (like Anthropic via a proxy or similar),
-            # it might not support response_format={"type": "json_object"}.
-
-            # Let's try to detect if we should omit response_format based on the error,
-            # but we can't easily do that in a single try/catch block without retry logic.
-            # For now, let's make response_format optional if it fails, or just rely on the prompt.
-
-            # Actually, the safest bet for "OpenAI Compatible" generic usage is to NOT enforce response_format
-            # unless we know the model supports it, OR to catch the specific error and retry without it.
+            content = self._request(user_content, log)
 
-            try:
-                if not is_o1:
-                    kwargs["response_format"] = {"type": "json_object"}
-
-                log(
-                    "Attempting request with response_format={'type': 'json_object'}..."
-                )
-                response = self.client.chat.completions.create(**kwargs)
-            except Exception as e:
-                # If it fails with a BadRequest related to response_format, try again without it
-                if "response_format" in str(e) and "json_object" in kwargs.get(
-                    "response_format", {}
-                ).get("type", ""):
-                    log(f"[yellow]Request failed with response_format error: {e}[/]")
-                    log("Retrying without response_format...")
-                    del kwargs["response_format"]
-                    response = self.client.chat.completions.create(**kwargs)
-                else:
-                    raise e
-
-            log("[green]Response received![/]")
-            if hasattr(response, "usage") and response.usage:
-                log(
-                    f"Usage: {response.usage.total_tokens} tokens (Prompt: {response.usage.prompt_tokens}, Completion: {response.usage.completion_tokens})"
-                )
-
-            content = response.choices[0].message.content
-            log(f"Raw content: {content}")
-
-            if not content:
-                raise LLMTranslationError("Empty response from LLM")
-
-            # Clean up markdown code blocks if present
-            # Some LLMs return markdown code blocks even when asked for raw JSON
-            cleaned_content = content
-            if "```" in cleaned_content:
-                lines = cleaned_content.splitlines()
-                cleaned_lines = [
-                    line for line in lines if not line.strip().startswith("```")
-                ]
-                cleaned_content = "\n".join(cleaned_lines)
+            # Some LLMs wrap the JSON in markdown code blocks or add prose
+            # around it even when asked for raw JSON; keep the outermost object
+            start = content.find("{")
+            end = content.rfind("}")
+            cleaned_content = content[start : end + 1] if 0 <= start < end else content
 
-            translations = json.loads(cleaned_content)
+            translations = jsonio.loads(cleaned_content)
 
-            # Validate response contains expected locales
+            # Validate response contains expected keys and locales
             result = {}
-            for locale in target_locales:
-                if locale in translations:
-                    result[locale] = str(translations[locale])
-                else:
-                    log(f"[red]Missing translation for locale: {locale}[/]")
+            for key, _ in batch:
+                key_translations = translations.get(key)
+                if not isinstance(key_translations, dict):
+                    log(f"[red]Missing translations for key: {key}[/]")
+                    continue
+                result[key] = {}
+                for locale in target_locales:
+                    if locale in key_translations:
+                        result[key][locale] = str(key_translations[locale])
+                    else:
+                        log(
+                            f"[red]Missing translation for {key} in locale: {locale}[/]"
+                        )
 
             return result
 
         except Exception as e:
             log(f"[bold red]Error during translation: {e}[/]")
             raise LLMTranslationError(f"LLM translation failed: {e}")
+
+    def _request(self, user_content: Dict, log: Callable[[str], None]) -> str:
+        """Send a chat completion request and return the raw content."""
+        # o1-mini / o1-preview don't support response_format
+        is_o1 = self.model.startswith("o1-")
+        kwargs = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": self.SYSTEM_PROMPT},
+                {"role": "user", "content": json.dumps(user_content)},
+            ],
+        }
+
+        # Not every OpenAI-compatible endpoint (e.g. Claude via a proxy)
+        # accepts response_format={"type": "json_object"}, so request it
+        # first and retry without it if the endpoint rejects it.
+        try:
+            if not is_o1:
+                kwargs["response_format"] = {"type": "json_object"}
+
+            log("Attempting request with response_format={'type': 'json_object'}...")
+            response = self.client.chat.completions.create(**kwargs)
+        except Exception as e:
+            # If it fails with a BadRequest related to response_format, try again without it
+            if "response_format" in str(e) and "json_object" in kwargs.get(
+                "response_format", {}
+            ).get("type", ""):
+                log(f"[yellow]Request failed with response_format error: {e}[/]")
+                log("Retrying without response_format...")
+                del kwargs["response_format"]
+                response = self.client.chat.completions.create(**kwargs)
+            else:
+                raise e
+
+        log("[green]Response received![/]")
+        if hasattr(response, "usage") and response.usage:
+            log(
+                f"Usage: {response.usage.total_tokens} tokens (Prompt: {response.usage.prompt_tokens}, Completion: {response.usage.completion_tokens})"
+            )
+
+        content = response.choices[0].message.content
+        log(f"Raw content: {content}")
+
+        if not content:
+            raise LLMTranslationError("Empty response from LLM")
+
+        return content
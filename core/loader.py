@@ -3,15 +3,25 @@ Translation file loader - handles discovering and loading i18next JSON files.
 """
 
 import json
+import os
 import re
 import pickle
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Iterator, Optional, List, Tuple
 from dataclasses import dataclass
 
+from . import jsonio
 
-@dataclass
+# Accept simple locale codes like en, de, fr, en-US, pt-BR
+_LOCALE_RE = re.compile(r"^[A-Za-z]{2,5}(-[A-Za-z]{2,5})?$")
+
+# Directories never searched for locale files
+_IGNORED_DIRS = {".venv", "node_modules", ".git"}
+
+
+@dataclass(slots=True)
 class LocaleFile:
     """Represents a single locale's translation file."""
 
@@ -27,12 +37,15 @@ class TranslationFileLoader:
         self.directory = Path(directory)
         if not self.directory.exists():
             raise FileNotFoundError(f"Directory not found: {self.directory}")
+        self._cache_dir: Optional[Path] = None
 
     def _get_cache_dir(self) -> Path:
         """Get the directory for storing cache files."""
-        cache_dir = self.directory / ".lazyi18n" / "cache"
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        return cache_dir
+        if self._cache_dir is None:
+            cache_dir = self.directory / ".lazyi18n" / "cache"
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            self._cache_dir = cache_dir
+        return self._cache_dir
 
     def _get_cache_path(self, file_path: Path) -> Path:
         """Get the cache file path for a given source file."""
@@ -40,34 +53,91 @@ class TranslationFileLoader:
         file_hash = hashlib.md5(str(file_path.resolve()).encode()).hexdigest()
         return self._get_cache_dir() / f"{file_path.stem}_{file_hash}.pickle"
 
+    @staticmethod
+    def file_signature(file_path: Path) -> Tuple[int, int]:
+        """Get the (mtime_ns, size) a cache entry must match to be valid."""
+        stat = file_path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
     def _load_file(self, file_path: Path) -> Dict:
         """Load a single file, using cache if available and valid."""
         cache_path = self._get_cache_path(file_path)
+        signature = self.file_signature(file_path)
 
-        # Try loading from cache
-        if cache_path.exists():
-            try:
-                # Check if cache is newer than source file
-                if cache_path.stat().st_mtime > file_path.stat().st_mtime:
-                    with open(cache_path, "rb") as f:
-                        return pickle.load(f)
-            except Exception:
-                # Ignore cache errors and fall back to loading from source
-                pass
+        # Try loading from cache; entries are (signature, data) and only
+        # valid while the source file is unchanged
+        try:
+            with open(cache_path, "rb") as f:
+                cached_signature, data = pickle.load(f)
+            if cached_signature == signature:
+                return data
+        except Exception:
+            # Missing, outdated or unreadable cache: load from source
+            pass
 
         # Load from source
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(file_path, "rb") as f:
+            data = jsonio.loads(f.read())
+
+        self.store_cache(file_path, data, signature)
+        return data
 
-        # Save to cache
+    def store_cache(
+        self,
+        file_path: Path,
+        data: Dict,
+        signature: Optional[Tuple[int, int]] = None,
+    ) -> None:
+        """Cache parsed data for a file as it currently is on disk."""
         try:
-            with open(cache_path, "wb") as f:
-                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            if signature is None:
+                signature = self.file_signature(file_path)
+            with open(self._get_cache_path(file_path), "wb") as f:
+                pickle.dump((signature, data), f, protocol=pickle.HIGHEST_PROTOCOL)
         except Exception:
             # Ignore cache write errors
             pass
 
-        return data
+    @classmethod
+    def _walk_json_files(cls, directory: str) -> Iterator[str]:
+        """Yield paths of .json files below a directory, skipping ignored dirs."""
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in _IGNORED_DIRS:
+                    yield from cls._walk_json_files(entry.path)
+            elif entry.name.endswith(".json"):
+                yield entry.path
+
+    def _discover_files(self) -> Dict[str, Path]:
+        """
+        Walk the directory once and pick the file to load for each locale.
+        Precedence: <dir>/<locale>.json, then <dir>/locales/<locale>.json,
+        then the first other match in path order.
+        """
+        preferred_dirs = (self.directory, self.directory / "locales")
+
+        candidates: Dict[str, List[Path]] = {}
+        for file_path in self._walk_json_files(str(self.directory)):
+            locale = os.path.basename(file_path)[:-5]
+            if _LOCALE_RE.match(locale):
+                candidates.setdefault(locale, []).append(Path(file_path))
+
+        def _rank(path: Path):
+            parent = path.parent
+            for rank, preferred in enumerate(preferred_dirs):
+                if parent == preferred:
+                    return (rank, str(path))
+            return (len(preferred_dirs), str(path))
+
+        return {
+            locale: min(paths, key=_rank)
+            for locale, paths in sorted(candidates.items())
+        }
 
     def discover_locales(self) -> List[str]:
         """
@@ -76,62 +146,64 @@ class TranslationFileLoader:
         - en.json, de.json, fr.json (flat structure)
         - locales/en.json, locales/de.json (nested in locales folder)
         """
-        locales = []
-
-        def _is_locale_name(name: str) -> bool:
-            # Accept simple locale codes like en, de, fr, en-US, pt-BR
-            return re.match(r"^[A-Za-z]{2,5}(-[A-Za-z]{2,5})?$", name) is not None
-
-        ignored_dirs = {".venv", "node_modules", ".git"}
-
-        for file in self.directory.glob("**/*.json"):
-            if any(part in ignored_dirs for part in file.parts):
-                continue
-            locale = file.stem
-            if _is_locale_name(locale):
-                locales.append(locale)
-
-        return sorted(set(locales))
+        return list(self._discover_files())
 
     def load(self) -> Dict[str, LocaleFile]:
         """Load all translation files from the directory."""
         locale_files = {}
-        locales = self.discover_locales()
-
-        for locale in locales:
-            try:
-                # Try common patterns
-                file_path = self.directory / f"{locale}.json"
-                if not file_path.exists():
-                    file_path = self.directory / "locales" / f"{locale}.json"
-                if not file_path.exists():
-                    # Try recursive search
-                    matches = list(self.directory.glob(f"**/{locale}.json"))
-                    if matches:
-                        file_path = matches[0]
-                    else:
+        files = self._discover_files()
+        if not files:
+            return locale_files
+
+        # Parse files concurrently; results are collected in locale order
+        with ThreadPoolExecutor(max_workers=min(32, len(files))) as executor:
+            futures = {
+                locale: executor.submit(self._load_file, file_path)
+                for locale, file_path in files.items()
+            }
+
+            for locale, future in futures.items():
+                file_path = files[locale]
+                try:
+                    data = future.result()
+
+                    # Only accept object-based locale files
+                    if not isinstance(data, dict):
+                        print(f"Warning: Skipping {file_path} (expected JSON object)")
                         continue
 
-                data = self._load_file(file_path)
+                    locale_files[locale] = LocaleFile(
+                        locale=locale, path=file_path, data=data
+                    )
+                except (json.JSONDecodeError, IOError) as e:
+                    print(f"Warning: Failed to load {locale}.json: {e}")
+
+        return locale_files
 
-                # Only accept object-based locale files
-                if not isinstance(data, dict):
-                    print(f"Warning: Skipping {file_path} (expected JSON object)")
-                    continue
+    def _resolve_path(self, locale: str) -> Optional[Path]:
+        """Find the file for a single locale using the discovery precedence."""
+        if not _LOCALE_RE.match(locale):
+            return None
 
-                locale_files[locale] = LocaleFile(
-                    locale=locale, path=file_path, data=data
-                )
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Failed to load {locale}.json: {e}")
+        for candidate in (
+            self.directory / f"{locale}.json",
+            self.directory / "locales" / f"{locale}.json",
+        ):
+            if candidate.is_file():
+                return candidate
 
-        return locale_files
+        return self._discover_files().get(locale)
 
     def load_single(self, locale: str) -> Optional[Dict]:
         """Load a single locale file."""
-        locales = self.discover_locales()
-        if locale not in locales:
+        file_path = self._resolve_path(locale)
+        if file_path is None:
+            return None
+
+        try:
+            data = self._load_file(file_path)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Warning: Failed to load {locale}.json: {e}")
             return None
 
-        locale_file = self.load().get(locale)
-        return locale_file.data if locale_file else None
+        return data if isinstance(data, dict) else None
@@ -2,17 +2,25 @@
 Core data model - TranslationProject orchestrates everything.
 """
 
+import copy
+from collections import Counter, defaultdict
+from bisect import bisect_left
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Set, Optional
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterator, Mapping, Set, Optional, Tuple
 from dataclasses import dataclass
 
 from .loader import TranslationFileLoader, LocaleFile
 from .flatten import flatten_json, unflatten_json
-from .analyzer import TranslationGapAnalyzer
+from .analyzer import TranslationGap, TranslationGapAnalyzer
 from .writer import TranslationWriter
 
+# Marker value telling _sync_nested to remove a key
+_DELETE = object()
 
-@dataclass
+
+@dataclass(slots=True)
 class ProjectChange:
     """Represents a single change made to a translation."""
 
@@ -22,6 +30,16 @@ class ProjectChange:
     new_value: Optional[str]
 
 
+@dataclass
+class PendingSave:
+    """A locale's data and changes captured for one save."""
+
+    path: Path
+    data: Dict[str, Any]  # Snapshot to write, detached from the live data
+    changes: Dict[str, ProjectChange]  # Change records the snapshot includes
+    rebuilt: bool  # Data was rebuilt from the flattened view
+
+
 class TranslationProject:
     """
     Main orchestrator for translation file management.
@@ -39,29 +57,257 @@ class TranslationProject:
         self.flattened: Dict[str, Dict] = {}
         self.changes: Dict[str, ProjectChange] = {}
         self.unsaved_changes: Set[str] = set()
+        self._changes_per_locale: Counter = Counter()
+
+        # Bumped on every load, edit or save so views can tell when to
+        # re-query; inside batch() only once, when the batch ends
+        self.version = 0
+        self._batch_depth = 0
+        self._batch_changed = False
+
+        # (path, file signature) each flattened locale was built from; dropped once the
+        # locale is edited in memory so reloads know what can be reused
+        self._flattened_signatures: Dict[
+            str, Tuple[Path, Optional[Tuple[int, int]]]
+        ] = {}
+
+        # Index of key -> locales containing it, kept in sync by mutators
+        self._key_presence: Dict[str, Set[str]] = {}
+        # Keys present in every locale, updated as presence changes
+        self._complete_keys: Set[str] = set()
+        # Locale -> keys it is missing, updated as presence changes
+        self._missing_by_locale: Dict[str, Set[str]] = {}
+        # Key -> gap for every key missing somewhere, updated per key so
+        # unchanged gaps keep their objects across analyses
+        self._gaps: Dict[str, TranslationGap] = {}
+
+        # Locales whose nested data could not be kept in sync with edits
+        self._nested_stale: Set[str] = set()
+
+        # Cached analysis results, cleared whenever translations change
+        self._gaps_cache: Optional[Mapping] = None
+        self._coverage_cache: Optional[Mapping[str, float]] = None
+        self._all_keys_cache: Optional[FrozenSet[str]] = None
+        self._sorted_keys_cache: Optional[Tuple[str, ...]] = None
+        self._categorized_keys_cache: Optional[
+            Tuple[Tuple[str, ...], Mapping[str, Tuple[str, ...]]]
+        ] = None
+        self._complete_keys_cache: Optional[FrozenSet[str]] = None
+        self._missing_by_locale_cache: Optional[Mapping[str, FrozenSet[str]]] = None
+        # Sorted locale codes (cleared on load) and keys with pending changes
+        # (cleared whenever a change is recorded or dropped)
+        self._locales_cache: Optional[Tuple[str, ...]] = None
+        self._changed_keys_cache: Optional[FrozenSet[str]] = None
+
+    def _invalidate_analysis(self) -> None:
+        """Drop cached results after a key appeared or vanished in a locale."""
+        self._gaps_cache = None
+        self._coverage_cache = None
+        self._complete_keys_cache = None
+        self._missing_by_locale_cache = None
+
+    def _invalidate_keys(
+        self, added: Optional[str] = None, removed: Optional[str] = None
+    ) -> None:
+        """
+        Drop key-set caches after a key was added to or removed from the
+        project. A cached sorted tuple is spliced instead of re-sorted.
+        """
+        self._all_keys_cache = None
+        self._categorized_keys_cache = None
+        keys = self._sorted_keys_cache
+        if keys is None or (added is None and removed is None):
+            self._sorted_keys_cache = None
+        elif added is not None:
+            i = bisect_left(keys, added)
+            self._sorted_keys_cache = keys[:i] + (added,) + keys[i:]
+        else:
+            i = bisect_left(keys, removed)
+            self._sorted_keys_cache = keys[:i] + keys[i + 1 :]
+
+    def _bump_version(self) -> None:
+        """Record that keys or values changed."""
+        if self._batch_depth:
+            self._batch_changed = True
+        else:
+            self.version += 1
+
+    @contextmanager
+    def batch(self) -> Iterator["TranslationProject"]:
+        """
+        Group several edits so the version is bumped once, when the
+        outermost batch exits. Analysis caches are still kept current.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_changed:
+                self._batch_changed = False
+                self.version += 1
+
+    def _mark_present(self, locale: str, key: str) -> None:
+        """Record that a key now exists in a locale."""
+        present = self._key_presence.get(key)
+        if present is None:
+            present = self._key_presence[key] = {locale}
+            # A new key is missing everywhere else
+            for other, missing in self._missing_by_locale.items():
+                if other != locale:
+                    missing.add(key)
+            self._invalidate_keys(added=key)
+        elif locale in present:
+            return
+        else:
+            present.add(locale)
+            self._missing_by_locale[locale].discard(key)
+        if len(present) == len(self.flattened):
+            self._complete_keys.add(key)
+        self._update_gap(key)
+        self._invalidate_analysis()
+
+    def _update_gap(self, key: str) -> None:
+        """Recompute the gap entry of one key after its presence changed."""
+        present = self._key_presence.get(key)
+        if present is None or len(present) == len(self.flattened):
+            self._gaps.pop(key, None)
+        else:
+            self._gaps[key] = TranslationGap(
+                key=key,
+                missing_in=tuple(loc for loc in self.flattened if loc not in present),
+                present_in=tuple(loc for loc in self.flattened if loc in present),
+            )
+
+    def _mark_absent(self, locale: str, key: str) -> None:
+        """Record that a key no longer exists in a locale."""
+        present = self._key_presence.get(key)
+        if present is None or locale not in present:
+            return
+        present.discard(locale)
+        self._complete_keys.discard(key)
+        if not present:
+            del self._key_presence[key]
+            self._invalidate_keys(removed=key)
+            # The key is gone entirely, so no locale is missing it
+            for missing in self._missing_by_locale.values():
+                missing.discard(key)
+        else:
+            self._missing_by_locale[locale].add(key)
+        self._update_gap(key)
+        self._invalidate_analysis()
 
     def load(self) -> bool:
         """Load all translation files."""
         try:
-            self.locale_files = self.loader.load()
-            self._flatten_all()
-            return bool(self.locale_files)
+            return self.apply_loaded(self.loader.load())
         except Exception as e:
             print(f"Error loading translations: {e}")
             return False
 
+    def apply_loaded(self, locale_files: Dict[str, LocaleFile]) -> bool:
+        """
+        Take over locale files read by self.loader.load(). Reading can run
+        on a worker thread; this part updates project state and must not.
+        """
+        self.locale_files = locale_files
+        self._locales_cache = None
+        self._flatten_all()
+        return bool(self.locale_files)
+
+    @staticmethod
+    def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+        """
+        Get a file's (mtime_ns, size) as the loader's cache uses it, or None
+        if it cannot be read.
+        """
+        try:
+            return TranslationFileLoader.file_signature(path)
+        except OSError:
+            return None
+
     def _flatten_all(self) -> None:
-        """Flatten all loaded locale files."""
+        """
+        Flatten all loaded locale files.
+        Locales whose file is unchanged since the last flatten (and which
+        were not edited in memory) reuse their existing flattened dict.
+        """
+        previous = self.flattened
+        signatures = {}
         self.flattened = {}
         for locale, locale_file in self.locale_files.items():
-            self.flattened[locale] = flatten_json(locale_file.data)
+            stamp = (locale_file.path, self._file_signature(locale_file.path))
+            if locale in previous and self._flattened_signatures.get(locale) == stamp:
+                self.flattened[locale] = previous[locale]
+            else:
+                self.flattened[locale] = flatten_json(locale_file.data)
+            signatures[locale] = stamp
+        self._flattened_signatures = signatures
+        self._nested_stale = set()
+
+        presence = defaultdict(set)
+        for locale, data in self.flattened.items():
+            for key in data:
+                presence[key].add(locale)
+        self._key_presence = dict(presence)
+        total = len(self.flattened)
+        self._complete_keys = {
+            key for key, present in self._key_presence.items() if len(present) == total
+        }
+        self._invalidate_keys()
+        self._missing_by_locale = {locale: set() for locale in self.flattened}
+        for key, present in self._key_presence.items():
+            if len(present) < total:
+                for locale, missing in self._missing_by_locale.items():
+                    if locale not in present:
+                        missing.add(key)
+        self._gaps = TranslationGapAnalyzer.analyze_presence(
+            self._key_presence, list(self.flattened)
+        )
+        self._invalidate_analysis()
+        self._bump_version()
 
-    def get_all_keys(self) -> set:
+    def get_all_keys(self) -> FrozenSet[str]:
         """Get all translation keys across all locales."""
-        all_keys = set()
-        for data in self.flattened.values():
-            all_keys.update(data.keys())
-        return sorted(all_keys)
+        if self._all_keys_cache is None:
+            self._all_keys_cache = frozenset(self._key_presence)
+        return self._all_keys_cache
+
+    def get_all_keys_sorted(self) -> Tuple[str, ...]:
+        """Get all translation keys across all locales, sorted."""
+        if self._sorted_keys_cache is None:
+            self._sorted_keys_cache = tuple(sorted(self.get_all_keys()))
+        return self._sorted_keys_cache
+
+    def get_categorized_keys(
+        self,
+    ) -> Tuple[Tuple[str, ...], Mapping[str, Tuple[str, ...]]]:
+        """
+        Get sorted keys grouped by category (the part before the first dot).
+
+        Returns:
+            Top-level keys without a category, and category -> keys with
+            categories in sorted order (cached until keys change)
+        """
+        if self._categorized_keys_cache is None:
+            top_level = []
+            categories = defaultdict(list)
+            for key in self.get_all_keys_sorted():
+                category, sep, _ = key.partition(".")
+                if sep:
+                    categories[category].append(key)
+                else:
+                    top_level.append(key)
+            self._categorized_keys_cache = (
+                tuple(top_level),
+                MappingProxyType(
+                    {
+                        category: tuple(categories[category])
+                        for category in sorted(categories)
+                    }
+                ),
+            )
+        return self._categorized_keys_cache
 
     def get_key_value(self, locale: str, key: str) -> Optional[str]:
         """Get the value of a key in a specific locale."""
@@ -77,37 +323,115 @@ class TranslationProject:
         if locale not in self.flattened:
             return False
 
+        existed = key in self.flattened[locale]
         old_value = self.flattened[locale].get(key)
+        if existed and old_value == value:
+            # Nothing changes, so the locale's file need not be rewritten
+            return True
         self.flattened[locale][key] = value
-
-        change_id = f"{locale}:{key}"
-        self.changes[change_id] = ProjectChange(
-            locale=locale,
-            key=key,
-            old_value=old_value,
-            new_value=value,
+        self._flattened_signatures.pop(locale, None)
+        self._bump_version()
+        self._sync_nested(locale, key, value, existed)
+        # Only a new key changes gaps/coverage; value edits do not
+        self._mark_present(locale, key)
+
+        self._record_change(
+            ProjectChange(
+                locale=locale,
+                key=key,
+                old_value=old_value,
+                new_value=value,
+            )
         )
-        self.unsaved_changes.add(locale)
         return True
 
     def delete_key_value(self, locale: str, key: str) -> bool:
         """Delete a translation value for a key in a specific locale."""
         if locale not in self.flattened:
             return False
-        old_value = self.flattened[locale].get(key)
-        if key in self.flattened[locale]:
-            del self.flattened[locale][key]
-
-        change_id = f"{locale}:{key}"
-        self.changes[change_id] = ProjectChange(
-            locale=locale,
-            key=key,
-            old_value=old_value,
-            new_value=None,
+        if key not in self.flattened[locale]:
+            # Nothing to delete, so the locale's file need not be rewritten
+            return True
+        old_value = self.flattened[locale][key]
+        del self.flattened[locale][key]
+        self._flattened_signatures.pop(locale, None)
+        self._bump_version()
+        self._sync_nested(locale, key, _DELETE, True)
+        self._mark_absent(locale, key)
+
+        self._record_change(
+            ProjectChange(
+                locale=locale,
+                key=key,
+                old_value=old_value,
+                new_value=None,
+            )
         )
-        self.unsaved_changes.add(locale)
         return True
 
+    def _sync_nested(self, locale: str, key: str, value: Any, existed: bool) -> None:
+        """
+        Mirror an edit of the flattened view into the locale's nested data,
+        so saving does not have to rebuild it. Pass _DELETE as value to
+        remove the key (pruning emptied parents). If the nested structure
+        cannot represent the edit (e.g. a leaf where a branch is needed),
+        the locale is marked stale and rebuilt from the flattened view on save.
+        """
+        if locale in self._nested_stale:
+            return
+
+        parts = key.split(".")
+        leaf = parts[-1]
+        node = self.locale_files[locale].data
+        parents = []
+
+        # Walk the existing path without creating anything, so bailing out
+        # below leaves the nested data untouched
+        for depth, part in enumerate(parts[:-1]):
+            child = node.get(part)
+            if child is None:
+                # Only a brand-new key may create the missing parents; a key
+                # that existed must be stored differently (e.g. literally
+                # dotted) and a delete has nothing to remove
+                if value is _DELETE or existed:
+                    self._nested_stale.add(locale)
+                    return
+                for missing in parts[depth:-1]:
+                    child = node[missing] = {}
+                    node = child
+                node[leaf] = value
+                return
+            if not isinstance(child, dict):
+                self._nested_stale.add(locale)
+                return
+            parents.append((node, part))
+            node = child
+
+        current = node.get(leaf, _DELETE)
+        if isinstance(current, dict) or (existed and current is _DELETE):
+            # Key is stored differently in the file (e.g. a literal dotted key)
+            self._nested_stale.add(locale)
+            return
+
+        if value is not _DELETE:
+            node[leaf] = value
+            return
+
+        del node[leaf]
+        while parents and not node:
+            parent, part = parents.pop()
+            del parent[part]
+            node = parent
+
+    def _record_change(self, change: ProjectChange) -> None:
+        """Record a pending change, replacing any earlier one for the same value."""
+        change_id = f"{change.locale}:{change.key}"
+        if change_id not in self.changes:
+            self._changes_per_locale[change.locale] += 1
+        self.changes[change_id] = change
+        self.unsaved_changes.add(change.locale)
+        self._changed_keys_cache = None
+
     def discard_key_changes(self, key: str) -> bool:
         """
         Discard all unsaved changes for a specific key.
@@ -120,44 +444,91 @@ class TranslationProject:
         if not changes_to_discard:
             return False
 
+        self._bump_version()
+
         for change_id, change in changes_to_discard:
             locale = change.locale
+            self._flattened_signatures.pop(locale, None)
 
             # Revert value
             if change.old_value is None:
                 # It was a new key, so remove it
                 if locale in self.flattened and key in self.flattened[locale]:
                     del self.flattened[locale][key]
+                    self._sync_nested(locale, key, _DELETE, True)
+                    self._mark_absent(locale, key)
             else:
                 # Restore old value
                 if locale in self.flattened:
+                    existed = key in self.flattened[locale]
                     self.flattened[locale][key] = change.old_value
+                    self._sync_nested(locale, key, change.old_value, existed)
+                    self._mark_present(locale, key)
 
             # Remove change record
             del self.changes[change_id]
+            self._changed_keys_cache = None
 
             # Check if locale still has changes
-            locale_has_changes = any(c.locale == locale for c in self.changes.values())
-            if not locale_has_changes:
+            self._changes_per_locale[locale] -= 1
+            if self._changes_per_locale[locale] <= 0:
+                del self._changes_per_locale[locale]
                 self.unsaved_changes.discard(locale)
 
         return True
 
-    def get_gaps(self) -> Dict:
-        """Get all translation gaps."""
-        return TranslationGapAnalyzer.analyze(self.flattened)
-
-    def get_coverage(self) -> Dict[str, float]:
-        """Get translation coverage percentage per locale."""
-        return TranslationGapAnalyzer.get_coverage_percentage(self.flattened)
-
-    def get_locales(self) -> list:
-        """Get list of all loaded locales."""
-        return sorted(self.locale_files.keys())
-
-    def get_changed_keys(self) -> Set[str]:
-        """Get set of keys that have unsaved changes."""
-        return {change.key for change in self.changes.values()}
+    def get_gaps(self) -> Mapping:
+        """Get all translation gaps (cached until the next mutation)."""
+        if self._gaps_cache is None:
+            self._gaps_cache = MappingProxyType(dict(self._gaps))
+        return self._gaps_cache
+
+    def get_coverage(self) -> Mapping[str, float]:
+        """Get translation coverage percentage per locale (cached)."""
+        if self._coverage_cache is None:
+            # Derived from the incrementally kept presence and missing sets,
+            # so this is O(locales) instead of a pass over every key
+            total = len(self._key_presence)
+            coverage = {}
+            if total:
+                coverage = {
+                    locale: ((total - len(self._missing_by_locale[locale])) / total)
+                    * 100
+                    for locale in self.flattened
+                }
+            self._coverage_cache = MappingProxyType(coverage)
+        return self._coverage_cache
+
+    def get_complete_keys(self) -> FrozenSet[str]:
+        """Get keys that exist in all locales."""
+        if self._complete_keys_cache is None:
+            self._complete_keys_cache = frozenset(self._complete_keys)
+        return self._complete_keys_cache
+
+    def get_missing_by_locale(self) -> Mapping[str, FrozenSet[str]]:
+        """Get the keys each locale is missing (cached until the next mutation)."""
+        if self._missing_by_locale_cache is None:
+            self._missing_by_locale_cache = MappingProxyType(
+                {
+                    locale: frozenset(missing)
+                    for locale, missing in self._missing_by_locale.items()
+                }
+            )
+        return self._missing_by_locale_cache
+
+    def get_locales(self) -> Tuple[str, ...]:
+        """Get all loaded locales, sorted (cached until the next load)."""
+        if self._locales_cache is None:
+            self._locales_cache = tuple(sorted(self.locale_files))
+        return self._locales_cache
+
+    def get_changed_keys(self) -> FrozenSet[str]:
+        """Get keys that have unsaved changes (cached until changes move)."""
+        if self._changed_keys_cache is None:
+            self._changed_keys_cache = frozenset(
+                change.key for change in self.changes.values()
+            )
+        return self._changed_keys_cache
 
     def save(self, locale: Optional[str] = None) -> bool:
         """
@@ -171,27 +542,84 @@ class TranslationProject:
         """
         if not self.unsaved_changes:
             return True
+        pending = self.prepare_save(locale)
+        return self.finish_save(pending, self.write_pending(pending))
 
+    def prepare_save(self, locale: Optional[str] = None) -> Dict[str, PendingSave]:
+        """
+        Capture what to write per locale (all unsaved locales, or just the
+        given one). The snapshots are copies, so edits made while they are
+        written neither leak into the files nor count as saved.
+        """
         locales_to_save = [locale] if locale else list(self.unsaved_changes)
-        all_success = True
-
+        pending = {}
         for loc in locales_to_save:
             if loc not in self.locale_files:
                 continue
 
-            # Unflatten back to nested structure
-            nested_data = unflatten_json(self.flattened[loc])
-
-            # Write to file
-            locale_file = self.locale_files[loc]
-            if self.writer.write_atomic(nested_data, locale_file.path):
-                self.unsaved_changes.discard(loc)
-                # Remove changes for this locale
-                keys_to_remove = [k for k, v in self.changes.items() if v.locale == loc]
-                for k in keys_to_remove:
-                    del self.changes[k]
+            # The nested data is kept in sync with edits; only rebuild it
+            # from the flattened view when that was not possible
+            rebuilt = loc in self._nested_stale
+            if rebuilt:
+                data = unflatten_json(self.flattened[loc])
             else:
+                data = copy.deepcopy(self.locale_files[loc].data)
+            pending[loc] = PendingSave(
+                path=self.locale_files[loc].path,
+                data=data,
+                changes={
+                    cid: change
+                    for cid, change in self.changes.items()
+                    if change.locale == loc
+                },
+                rebuilt=rebuilt,
+            )
+        return pending
+
+    def write_pending(self, pending: Dict[str, PendingSave]) -> Dict[Path, bool]:
+        """
+        Write snapshots from prepare_save() concurrently. Only touches files,
+        so it can run on a worker thread.
+        """
+        return self.writer.write_many({p.path: p.data for p in pending.values()})
+
+    def finish_save(
+        self, pending: Dict[str, PendingSave], results: Dict[Path, bool]
+    ) -> bool:
+        """
+        Mark the captured changes of each written locale as saved. Changes
+        recorded after prepare_save() stay pending.
+
+        Returns:
+            True if every pending locale was written
+        """
+        all_success = True
+        for loc, saved in pending.items():
+            if not results.get(saved.path):
                 all_success = False
+                continue
+
+            # Let the next load skip parsing the file just written
+            self.loader.store_cache(saved.path, saved.data)
+            for cid, change in saved.changes.items():
+                # A newer edit replaces the record; a discard removes it
+                if self.changes.get(cid) is change:
+                    del self.changes[cid]
+                    self._changes_per_locale[loc] -= 1
+            self._changed_keys_cache = None
+
+            if self._changes_per_locale.get(loc, 0) <= 0:
+                self._changes_per_locale.pop(loc, None)
+                self.unsaved_changes.discard(loc)
+                # The live nested data only needs the rebuilt snapshot when
+                # nothing was edited since
+                if saved.rebuilt and loc in self.locale_files:
+                    self.locale_files[loc].data = saved.data
+                    self._nested_stale.discard(loc)
+
+        if pending:
+            # Saved keys are no longer reported as changed
+            self._bump_version()
 
         return all_success
 
@@ -203,8 +631,57 @@ class TranslationProject:
         """Get list of locales with unsaved changes."""
         return sorted(self.unsaved_changes)
 
+    def reload_locale(self, locale: str) -> bool:
+        """
+        Reload a single locale from disk (discarding its unsaved changes).
+        Only that locale's keys are re-indexed.
+        """
+        locale_file = self.locale_files.get(locale)
+        if locale_file is None:
+            return False
+
+        # The loader reports unreadable or non-object files itself
+        data = self.loader.load_single(locale)
+        if data is None:
+            return False
+
+        old_keys = self.flattened.get(locale, {}).keys()
+        flat = flatten_json(data)
+        for key in old_keys - flat.keys():
+            self._mark_absent(locale, key)
+        for key in flat.keys() - old_keys:
+            self._mark_present(locale, key)
+
+        locale_file.data = data
+        self.flattened[locale] = flat
+        self._nested_stale.discard(locale)
+        self._bump_version()
+        self._flattened_signatures[locale] = (
+            locale_file.path,
+            self._file_signature(locale_file.path),
+        )
+
+        # Drop pending changes for this locale
+        for change_id in [k for k, v in self.changes.items() if v.locale == locale]:
+            del self.changes[change_id]
+        self._changed_keys_cache = None
+        self.unsaved_changes.discard(locale)
+        self._changes_per_locale.pop(locale, None)
+        return True
+
     def reload(self) -> bool:
         """Reload all files from disk (discarding unsaved changes)."""
+        self._drop_all_changes()
+        return self.load()
+
+    def apply_reload(self, locale_files: Dict[str, LocaleFile]) -> bool:
+        """Like reload(), with files already read by self.loader.load()."""
+        self._drop_all_changes()
+        return self.apply_loaded(locale_files)
+
+    def _drop_all_changes(self) -> None:
+        """Forget every pending change."""
         self.changes.clear()
         self.unsaved_changes.clear()
-        return self.load()
+        self._changed_keys_cache = None
+        self._changes_per_locale.clear()
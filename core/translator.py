@@ -3,9 +3,24 @@ Machine translation support for lazyi18n.
 Currently supports Google Translate API via deep-translator.
 """
 
-from typing import Optional, Dict
+import functools
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Sequence, Tuple
 from deep_translator import GoogleTranslator
 
+logger = logging.getLogger("lazyi18n.translator")
+
+# Google Translate rejects requests longer than this
+MAX_REQUEST_CHARS = 5000
+
+# Indexed marker placed on its own line before each text in a batched
+# request; the indices must come back in order for the split to be trusted
+BATCH_MARKER = "[[{}]]"
+BATCH_MARKER_RE = re.compile(r"\n?\[\[(\d+)\]\]\n?")
+
 
 class TranslationError(Exception):
     """Raised when translation fails."""
@@ -13,6 +28,39 @@ class TranslationError(Exception):
     pass
 
 
+# One GoogleTranslator per (source, target) language pair, each with a lock
+_translators: Dict[Tuple[str, str], Tuple[GoogleTranslator, threading.Lock]] = {}
+_translators_lock = threading.Lock()
+
+
+def _get_google_translator(
+    src_lang: str, dest_lang: str
+) -> Tuple[GoogleTranslator, threading.Lock]:
+    """Get (or create) the shared translator for a language pair."""
+    with _translators_lock:
+        entry = _translators.get((src_lang, dest_lang))
+        if entry is None:
+            translator = GoogleTranslator(source=src_lang, target=dest_lang)
+            entry = _translators[(src_lang, dest_lang)] = (translator, threading.Lock())
+    return entry
+
+
+@functools.lru_cache(maxsize=4096)
+def _translate_cached(text: str, src_lang: str, dest_lang: str) -> Optional[str]:
+    """
+    Translate text between language codes, memoized so repeated strings
+    ("OK", "Cancel", ...) are only sent once per process.
+    Failures raise and are therefore not cached.
+    """
+    try:
+        translator, lock = _get_google_translator(src_lang, dest_lang)
+        # deep-translator stores request params on the instance
+        with lock:
+            return translator.translate(text)
+    except Exception as e:
+        raise TranslationError(f"Translation failed: {e}")
+
+
 class Translator:
     """Handles machine translation for missing keys."""
 
@@ -39,17 +87,84 @@ class Translator:
         if not text:
             return None
 
-        try:
-            # Convert locale codes to language codes (e.g., 'en-US' -> 'en')
-            src_lang = source_locale.split("-")[0].lower()
-            dest_lang = target_locale.split("-")[0].lower()
+        # Convert locale codes to language codes (e.g., 'en-US' -> 'en')
+        src_lang = source_locale.split("-")[0].lower()
+        dest_lang = target_locale.split("-")[0].lower()
 
-            translator = GoogleTranslator(source=src_lang, target=dest_lang)
-            return translator.translate(text)
-        except Exception as e:
-            raise TranslationError(f"Translation failed: {e}")
+        return _translate_cached(text, src_lang, dest_lang)
+
+    def translate_batch(
+        self, texts: List[str], source_locale: str, target_locale: str
+    ) -> List[Optional[str]]:
+        """
+        Translate several texts with as few requests as possible.
+        Each text is preceded by an indexed marker line and the texts are
+        sent together (up to the request size limit), then split back
+        apart on the markers. If the markers do not all come back in
+        order, each text is translated on its own.
+
+        Args:
+            texts: Texts to translate
+            source_locale: Source language code (e.g., 'en')
+            target_locale: Target language code (e.g., 'de')
+
+        Returns:
+            Translations in the same order as texts
+
+        Raises:
+            TranslationError: If a request fails
+        """
+        results: List[Optional[str]] = []
+        chunk: List[str] = []
+        size = 0
+
+        def split(translated: str) -> Optional[List[str]]:
+            # Only the newlines around each marker belong to the separator
+            pieces = BATCH_MARKER_RE.split(translated)
+            indices = pieces[1::2]
+            if pieces[0].strip() or indices != [str(i) for i in range(len(chunk))]:
+                return None
+            return pieces[2::2]
+
+        def flush():
+            if not chunk:
+                return
+            if len(chunk) == 1:
+                results.append(self.translate(chunk[0], source_locale, target_locale))
+                return
+            joined = "\n".join(
+                f"{BATCH_MARKER.format(i)}\n{text}" for i, text in enumerate(chunk)
+            )
+            translated = self.translate(joined, source_locale, target_locale) or ""
+            parts = split(translated)
+            if parts is not None:
+                results.extend(parts)
+            else:
+                results.extend(
+                    self.translate(text, source_locale, target_locale) for text in chunk
+                )
+
+        for text in texts:
+            if not text or BATCH_MARKER_RE.search(text):
+                # Can't be joined safely; keep positions aligned
+                flush()
+                chunk, size = [], 0
+                results.append(self.translate(text, source_locale, target_locale))
+                continue
+            # Marker plus the two newlines around it
+            added = len(text) + len(BATCH_MARKER.format(len(chunk))) + 2
+            if chunk and size + added > MAX_REQUEST_CHARS:
+                flush()
+                chunk, size = [], 0
+            chunk.append(text)
+            size += added
+
+        flush()
+        return results
 
-    def detect_source_locale(self, project, key: str) -> Optional[str]:
+    def detect_source_locale(
+        self, project, key: str, locales: Optional[Sequence[str]] = None
+    ) -> Optional[str]:
         """
         Detect the best source locale for a key.
         Returns the first locale that has a value for the key.
@@ -57,16 +172,105 @@ class Translator:
         Args:
             project: TranslationProject instance
             key: Translation key
+            locales: Candidate locales in order (default: all project locales)
 
         Returns:
             Locale code or None if key not found in any locale
         """
-        for locale in project.get_locales():
+        if locales is None:
+            locales = project.get_locales()
+        for locale in locales:
             value = project.get_key_value(locale, key)
             if value:
                 return locale
         return None
 
+    def _resolve_source(
+        self,
+        project,
+        key: str,
+        source_locale: Optional[str],
+        candidates: Optional[Sequence[str]] = None,
+    ) -> Tuple[str, str]:
+        """
+        Pick the source locale and text for a key.
+
+        Raises:
+            TranslationError: If no source text is available
+        """
+        # Auto-detect source locale if not provided
+        if not source_locale:
+            source_locale = self.detect_source_locale(project, key, candidates)
+            if not source_locale:
+                raise TranslationError(f"No source text found for key: {key}")
+
+        # Get source text
+        source_text = project.get_key_value(source_locale, key)
+        if not source_text:
+            raise TranslationError(f"No text found in {source_locale} for key: {key}")
+
+        return source_locale, source_text
+
+    def _translate_worklist(
+        self,
+        worklist: List[Tuple[str, str, str, str]],
+        max_workers: int = 8,
+    ) -> Dict[Tuple[str, str], str]:
+        """
+        Translate (key, source_locale, source_text, target_locale) items,
+        batching texts per locale pair and running pairs concurrently.
+
+        Returns:
+            Dictionary mapping (target_locale, key) -> translated text,
+            in worklist order. Failed items are skipped with a warning.
+        """
+        if not worklist:
+            return {}
+
+        # One batched request per (source, target) pair
+        groups: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+        for key, src, text, target_locale in worklist:
+            groups.setdefault((src, target_locale), []).append((key, text))
+
+        def translate_group(src: str, target_locale: str, items):
+            try:
+                texts = [text for _, text in items]
+                translated = self.translate_batch(texts, src, target_locale)
+                return list(zip(items, translated))
+            except TranslationError:
+                pass
+
+            # Batch failed: retry one by one so a single bad text
+            # doesn't lose the whole group
+            results = []
+            for item in items:
+                key, text = item
+                try:
+                    results.append((item, self.translate(text, src, target_locale)))
+                except TranslationError as e:
+                    logger.warning(
+                        "Failed to translate %s to %s: %s", key, target_locale, e
+                    )
+            return results
+
+        done: Dict[Tuple[str, str], str] = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as pool:
+            futures = [
+                (target_locale, pool.submit(translate_group, src, target_locale, items))
+                for (src, target_locale), items in groups.items()
+            ]
+            for target_locale, future in futures:
+                for (key, _), translated in future.result():
+                    if translated:
+                        done[(target_locale, key)] = translated
+
+        # Report in worklist order
+        return {
+            (target_locale, key): done[(target_locale, key)]
+            for key, _, _, target_locale in worklist
+            if (target_locale, key) in done
+        }
+
     def translate_missing(
         self,
         project,
@@ -84,34 +288,24 @@ class Translator:
         Returns:
             Dictionary mapping locale -> translated text for missing locales
         """
-        # Auto-detect source locale if not provided
-        if not source_locale:
-            source_locale = self.detect_source_locale(project, key)
-            if not source_locale:
-                raise TranslationError(f"No source text found for key: {key}")
-
-        # Get source text
-        source_text = project.get_key_value(source_locale, key)
-        if not source_text:
-            raise TranslationError(f"No text found in {source_locale} for key: {key}")
-
         # Find missing locales
-        gaps = project.get_gaps()
-        missing_locales = []
-        if key in gaps:
-            missing_locales = gaps[key].missing_in
+        gap = project.get_gaps().get(key)
+        missing_locales = gap.missing_in if gap else ()
 
-        # Translate for each missing locale
-        translations = {}
-        for target_locale in missing_locales:
-            try:
-                translated = self.translate(source_text, source_locale, target_locale)
-                if translated:
-                    translations[target_locale] = translated
-            except TranslationError as e:
-                print(f"Warning: Failed to translate {key} to {target_locale}: {e}")
+        # Only locales that have the key can be the source
+        source_locale, source_text = self._resolve_source(
+            project, key, source_locale, gap.present_in if gap else None
+        )
 
-        return translations
+        # Translate for each missing locale
+        worklist = [
+            (key, source_locale, source_text, target_locale)
+            for target_locale in missing_locales
+        ]
+        return {
+            locale: text
+            for (locale, _), text in self._translate_worklist(worklist).items()
+        }
 
     def translate_all_missing(self, project, source_locale: Optional[str] = None):
         """
@@ -125,14 +319,18 @@ class Translator:
             Dictionary mapping (locale, key) -> translated text
         """
         gaps = project.get_gaps()
-        all_translations = {}
 
+        # Resolve the source once per key (only among locales that have
+        # it), then fan out per target locale
+        worklist = []
         for key, gap in gaps.items():
             try:
-                translations = self.translate_missing(project, key, source_locale)
-                for locale, text in translations.items():
-                    all_translations[(locale, key)] = text
+                src, text = self._resolve_source(
+                    project, key, source_locale, gap.present_in
+                )
             except TranslationError as e:
-                print(f"Warning: Failed to translate {key}: {e}")
+                logger.warning("Failed to translate %s: %s", key, e)
+                continue
+            worklist.extend((key, src, text, target) for target in gap.missing_in)
 
-        return all_translations
+        return self._translate_worklist(worklist)
@@ -2,10 +2,15 @@
 Safe JSON writer - handles saving translation files with proper formatting.
 """
 
-import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any
 
+from . import jsonio
+
 
 class TranslationWriter:
     """Safely writes translation JSON files."""
@@ -19,6 +24,10 @@ class TranslationWriter:
         """
         self.indent = indent
 
+    def _encode(self, data: Dict[str, Any]) -> bytes:
+        """Serialize data to formatted UTF-8 JSON (with trailing newline)."""
+        return jsonio.dumps(data, indent=self.indent)
+
     def write(
         self,
         data: Dict[str, Any],
@@ -42,24 +51,15 @@ class TranslationWriter:
             # Create backup if requested and file exists
             if create_backup and path.exists():
                 backup_path = path.with_suffix(".json.bak")
-                with open(path, "r", encoding="utf-8") as f:
-                    backup_data = f.read()
-                with open(backup_path, "w", encoding="utf-8") as f:
-                    f.write(backup_data)
+                shutil.copyfile(path, backup_path)
 
             # Ensure directory exists
             path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write JSON with formatting
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(
-                    data,
-                    f,
-                    indent=self.indent,
-                    ensure_ascii=False,
-                    sort_keys=False,
-                )
-                f.write("\n")  # Add trailing newline
+            # Encode in one pass, then write in a single call
+            content = self._encode(data)
+            with open(path, "wb") as f:
+                f.write(content)
 
             return True
 
@@ -83,36 +83,62 @@ class TranslationWriter:
         Returns:
             True if successful, False otherwise
         """
-        import tempfile
-        import shutil
-
         path = Path(path)
+        temp_path = None
 
         try:
+            # Encode in one pass; a single bytes write bypasses the file
+            # buffer, so the temp file is written without small chunked writes
+            content = self._encode(data)
+
             # Create temporary file in same directory (same filesystem)
             temp_dir = path.parent
             temp_dir.mkdir(parents=True, exist_ok=True)
 
             with tempfile.NamedTemporaryFile(
-                mode="w",
+                mode="wb",
                 dir=temp_dir,
                 suffix=".json",
                 delete=False,
-                encoding="utf-8",
             ) as temp_file:
                 temp_path = Path(temp_file.name)
-                json.dump(
-                    data,
-                    temp_file,
-                    indent=self.indent,
-                    ensure_ascii=False,
-                )
-                temp_file.write("\n")
-
-            # Move temp file to final location
-            shutil.move(str(temp_path), str(path))
+                temp_file.write(content)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+
+            # Keep the original file's permissions (temp files are 0600)
+            if path.exists():
+                shutil.copymode(path, temp_path)
+
+            # Atomically replace the final file (same filesystem)
+            os.replace(temp_path, path)
             return True
 
         except Exception as e:
             print(f"Error writing {path} atomically: {e}")
+            if temp_path is not None:
+                temp_path.unlink(missing_ok=True)
             return False
+
+    def write_many(self, items: Dict[Path, Dict[str, Any]]) -> Dict[Path, bool]:
+        """
+        Atomically write several files concurrently.
+
+        Args:
+            items: Mapping of path -> data to write
+
+        Returns:
+            Mapping of path -> True if that write succeeded
+        """
+        if not items:
+            return {}
+        if len(items) == 1:
+            ((path, data),) = items.items()
+            return {path: self.write_atomic(data, path)}
+
+        with ThreadPoolExecutor(max_workers=min(32, len(items))) as executor:
+            futures = {
+                path: executor.submit(self.write_atomic, data, path)
+                for path, data in items.items()
+            }
+            return {path: future.result() for path, future in futures.items()}
@@ -3,8 +3,10 @@
 lazyi18n - A TUI for managing i18next translation files.
 """
 
+import argparse
 import sys
 import os
+import logging
 import subprocess
 from importlib.metadata import version, PackageNotFoundError
 from pathlib import Path
@@ -14,10 +16,7 @@ try:
 except PackageNotFoundError:
     __version__ = "unknown"
 
-from ui.app import LazyI18nTUI
 from core.config import Config
-from core.translator import Translator, TranslationError
-from core.project import TranslationProject
 
 
 def handle_config_command(args):
@@ -107,6 +106,13 @@ def handle_config_command(args):
 
 def handle_translate_command(args):
     """Handle translate subcommand."""
+    # deep_translator pulls in requests; only this command needs it
+    from core.translator import Translator, TranslationError
+    from core.project import TranslationProject
+
+    # Show per-key translation warnings on the console
+    logging.basicConfig(level=logging.WARNING, format="Warning: %(message)s")
+
     project = TranslationProject(args.directory)
 
     print("Loading translations...")
@@ -155,10 +161,34 @@ def handle_translate_command(args):
         sys.exit(1)
 
 
-def main():
-    """Main entry point."""
-    import argparse
+def _add_tui_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the TUI's positional directory and --edit options to a parser."""
+    parser.add_argument(
+        "directory",
+        nargs="?",
+        default=".",
+        help="Path to directory with translation files (default: current directory)",
+    )
+    parser.add_argument(
+        "-e",
+        "--edit",
+        help="Start in edit mode for a specific key (creates it if missing)",
+        metavar="KEY",
+    )
 
+
+def _add_version_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the --version flag to a parser."""
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"lazyi18n {__version__}",
+        help="Show version information and exit",
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser with all subcommands."""
     parser = argparse.ArgumentParser(
         description="lazyi18n - TUI for managing i18next translations",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -170,18 +200,7 @@ def main():
     tui_parser = subparsers.add_parser(
         "tui", help="Launch the TUI (default)", add_help=False
     )
-    tui_parser.add_argument(
-        "directory",
-        nargs="?",
-        default=".",
-        help="Path to directory with translation files (default: current directory)",
-    )
-    tui_parser.add_argument(
-        "-e",
-        "--edit",
-        help="Start in edit mode for a specific key (creates it if missing)",
-        metavar="KEY",
-    )
+    _add_tui_arguments(tui_parser)
 
     # Config command
     config_parser = subparsers.add_parser("config", help="View or modify configuration")
@@ -231,15 +250,30 @@ def main():
     )
 
     # Global arguments
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"lazyi18n {__version__}",
-        help="Show version information and exit",
+    _add_version_argument(parser)
+
+    return parser
+
+
+def build_tui_parser() -> argparse.ArgumentParser:
+    """Build the parser for running the TUI without a subcommand."""
+    parser = argparse.ArgumentParser(
+        description="lazyi18n - TUI for managing i18next translations"
     )
+    _add_tui_arguments(parser)
+    _add_version_argument(parser)
+    return parser
+
+
+def main():
+    """Main entry point."""
+    # Answer the common version check before building any parser
+    if sys.argv[1:] == ["--version"]:
+        print(f"lazyi18n {__version__}")
+        return
 
     # Parse arguments
-    args = parser.parse_args()
+    args = build_parser().parse_args()
 
     # Handle subcommands
     if args.command == "config":
@@ -250,28 +284,10 @@ def main():
         # Default to TUI (either explicit 'tui' command or no command)
         if args.command is None:
             # No subcommand, parse as TUI with backward compatibility
-            parser = argparse.ArgumentParser(
-                description="lazyi18n - TUI for managing i18next translations"
-            )
-            parser.add_argument(
-                "directory",
-                nargs="?",
-                default=".",
-                help="Path to directory with translation files",
-            )
-            parser.add_argument(
-                "-e",
-                "--edit",
-                help="Start in edit mode for a specific key (creates it if missing)",
-                metavar="KEY",
-            )
-            parser.add_argument(
-                "--version",
-                action="version",
-                version=f"lazyi18n {__version__}",
-                help="Show version information and exit",
-            )
-            args = parser.parse_args()
+            args = build_tui_parser().parse_args()
+
+        # Import the UI stack only once we know the TUI is needed
+        from ui.app import LazyI18nTUI
 
         tui = LazyI18nTUI(args.directory, initial_key=getattr(args, "edit", None))
         app = tui.create_app()
@@ -2,9 +2,10 @@
 
 import pytest
 import tempfile
-import json
 from pathlib import Path
 
+from core import jsonio
+
 
 @pytest.fixture
 def temp_translations():
@@ -19,8 +20,8 @@ def temp_translations():
     }
     de_data = {"auth": {"login": "Anmelden"}, "dashboard": {"welcome": "Willkommen"}}
 
-    (temp_path / "en.json").write_text(json.dumps(en_data, indent=2))
-    (temp_path / "de.json").write_text(json.dumps(de_data, indent=2))
+    (temp_path / "en.json").write_bytes(jsonio.dumps(en_data))
+    (temp_path / "de.json").write_bytes(jsonio.dumps(de_data))
 
     yield temp_path
 
@@ -25,8 +25,8 @@ class TestTranslationGapAnalyzer:
 
         assert "auth.logout" in gaps
         gap = gaps["auth.logout"]
-        assert gap.missing_in == ["de"]
-        assert gap.present_in == ["en"]
+        assert gap.missing_in == ("de",)
+        assert gap.present_in == ("en",)
 
     def test_multiple_missing_keys(self):
         """Test multiple missing keys across locales."""
@@ -77,3 +77,31 @@ class TestTranslationGapAnalyzer:
 
         coverage = TranslationGapAnalyzer.get_coverage_percentage({})
         assert coverage == {}
+
+    def test_helpers_accept_precomputed_gaps(self):
+        """Test helpers reuse a precomputed analysis."""
+        locale_data = {
+            "en": {"key1": "v1", "key2": "v2"},
+            "de": {"key1": "v1"},
+        }
+        gaps = TranslationGapAnalyzer.analyze(locale_data)
+
+        assert TranslationGapAnalyzer.get_missing_keys_for_locale(
+            locale_data, "de", gaps=gaps
+        ) == ["key2"]
+        assert TranslationGapAnalyzer.get_complete_keys(locale_data, gaps=gaps) == [
+            "key1"
+        ]
+        coverage = TranslationGapAnalyzer.get_coverage_percentage(
+            locale_data, gaps=gaps
+        )
+        assert coverage == {"en": 100.0, "de": 50.0}
+
+    def test_analyze_presence(self):
+        """Test gap analysis from a key -> locales index."""
+        presence = {"key1": {"en", "de"}, "key2": {"en"}}
+        gaps = TranslationGapAnalyzer.analyze_presence(presence, ["de", "en"])
+
+        assert list(gaps) == ["key2"]
+        assert gaps["key2"].missing_in == ("de",)
+        assert gaps["key2"].present_in == ("en",)
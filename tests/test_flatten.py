@@ -1,5 +1,7 @@
 """Pytest tests for core/flatten.py"""
 
+import pytest
+
 from core.flatten import (
     flatten_json,
     unflatten_json,
@@ -40,6 +42,12 @@ class TestFlattenJson:
         expected = {"simple": "value", "nested.key": "nested_value"}
         assert result == expected
 
+    def test_preserves_key_order(self):
+        """Test keys come out in document order."""
+        data = {"b": {"y": "1", "x": "2"}, "a": "3", "c": {"z": {"w": "4"}}}
+        result = flatten_json(data)
+        assert list(result) == ["b.y", "b.x", "a", "c.z.w"]
+
 
 class TestUnflattenJson:
     """Test unflatten_json function."""
@@ -67,6 +75,25 @@ class TestUnflattenJson:
         result = unflatten_json({})
         assert result == {}
 
+    def test_interleaved_prefixes(self):
+        """Test keys sharing prefixes out of order keep insertion order."""
+        data = {"a.x.1": "v1", "b": "v2", "a.y": "v3", "a.x.2": "v4"}
+        result = unflatten_json(data)
+        assert result == {"a": {"x": {"1": "v1", "2": "v4"}, "y": "v3"}, "b": "v2"}
+        assert list(result) == ["a", "b"]
+        assert list(result["a"]) == ["x", "y"]
+
+    def test_value_then_nested_key_conflict(self):
+        """Test that a key nested under an existing value raises."""
+        with pytest.raises(ValueError):
+            unflatten_json({"a": "v1", "a.b": "v2"})
+
+    def test_nested_key_then_value_conflict(self):
+        """Test that a value replacing an existing parent raises."""
+        # Without the check "a.c" would land in the detached "a" container
+        with pytest.raises(ValueError):
+            unflatten_json({"a.b": "v1", "a": "v2", "a.c": "v3"})
+
 
 class TestGetNestedValue:
     """Test get_nested_value function."""
@@ -0,0 +1,130 @@
+"""Pytest tests for core/llm.py"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.llm import LLMTranslationError, LLMTranslator
+
+
+def make_response(content):
+    """Build a minimal chat completion response."""
+    message = SimpleNamespace(content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+def echo_completion(**kwargs):
+    """Answer a request with '<locale>:<source text>' for every item."""
+    request = json.loads(kwargs["messages"][1]["content"])
+    return make_response(
+        json.dumps(
+            {
+                item["key"]: {
+                    locale: f"{locale}:{item['source_text']}"
+                    for locale in request["target_locales"]
+                }
+                for item in request["items"]
+            }
+        )
+    )
+
+
+@pytest.fixture
+def translator(tmp_path):
+    """Create a translator whose client is mocked."""
+    translator = LLMTranslator(api_key="test", cache_dir=tmp_path)
+    translator.client = MagicMock()
+    translator.client.chat.completions.create.side_effect = echo_completion
+    return translator
+
+
+class TestLLMCache:
+    """Test the on-disk LLM translation cache."""
+
+    def test_cache_written_as_json(self, translator):
+        """Test that fresh translations are stored as a JSON object."""
+        translator.translate_key("greeting", "Hello", "en", ["de"])
+
+        data = json.loads(translator.cache_path.read_text(encoding="utf-8"))
+        assert list(data.values()) == ["de:Hello"]
+
+    def test_cache_reused_across_instances(self, translator, tmp_path):
+        """Test that a new translator answers from the saved cache."""
+        translator.translate_key("greeting", "Hello", "en", ["de"])
+
+        fresh = LLMTranslator(api_key="test", cache_dir=tmp_path)
+        fresh.client = MagicMock()
+        result = fresh.translate_key("greeting", "Hello", "en", ["de"])
+
+        assert result == {"de": "de:Hello"}
+        fresh.client.chat.completions.create.assert_not_called()
+
+    def test_corrupt_cache_ignored(self, translator):
+        """Test that an unreadable cache file starts an empty cache."""
+        translator.cache_path.write_bytes(b"\x80\x04not json")
+
+        result = translator.translate_key("greeting", "Hello", "en", ["de"])
+
+        assert result == {"de": "de:Hello"}
+        assert translator.client.chat.completions.create.call_count == 1
+
+    def test_cache_capped(self, translator):
+        """Test that the oldest entries are dropped past the cap."""
+        translator.MAX_CACHE_ENTRIES = 2
+        items = [("a", "One"), ("b", "Two"), ("c", "Three")]
+        translator.translate_keys_batch(items, "en", ["de"])
+
+        data = json.loads(translator.cache_path.read_text(encoding="utf-8"))
+        assert sorted(data.values()) == ["de:Three", "de:Two"]
+
+
+class TestTranslateKeysBatch:
+    """Test LLMTranslator.translate_keys_batch with a mocked client."""
+
+    def test_single_key(self, translator):
+        """Test that one key is translated in a single request."""
+        result = translator.translate_key("greeting", "Hello", "en", ["de", "fr"])
+
+        assert result == {"de": "de:Hello", "fr": "fr:Hello"}
+        assert translator.client.chat.completions.create.call_count == 1
+
+    def test_multiple_batches(self, translator):
+        """Test that keys are split into batches and merged back."""
+        items = [("a", "One"), ("b", "Two"), ("c", "Three")]
+        result = translator.translate_keys_batch(items, "en", ["de"], batch_size=2)
+
+        assert result == {
+            "a": {"de": "de:One"},
+            "b": {"de": "de:Two"},
+            "c": {"de": "de:Three"},
+        }
+        assert translator.client.chat.completions.create.call_count == 2
+
+    def test_failed_batch_returns_partial_results(self, translator):
+        """Test that a failing batch is logged and the others are kept."""
+
+        def flaky_completion(**kwargs):
+            request = json.loads(kwargs["messages"][1]["content"])
+            if request["items"][0]["key"] == "b":
+                raise RuntimeError("rate limited")
+            return echo_completion(**kwargs)
+
+        translator.client.chat.completions.create.side_effect = flaky_completion
+        logs = []
+        items = [("a", "One"), ("b", "Two"), ("c", "Three")]
+        result = translator.translate_keys_batch(
+            items, "en", ["de"], log_callback=logs.append, batch_size=1
+        )
+
+        assert result == {"a": {"de": "de:One"}, "c": {"de": "de:Three"}}
+        assert any("rate limited" in msg for msg in logs)
+        assert any("1 of 3 batch(es) failed" in msg for msg in logs)
+
+    def test_all_batches_failed_raises(self, translator):
+        """Test that an error is raised when nothing could be translated."""
+        translator.client.chat.completions.create.side_effect = RuntimeError("down")
+
+        with pytest.raises(LLMTranslationError):
+            translator.translate_key("greeting", "Hello", "en", ["de"])
@@ -1,5 +1,7 @@
 """Pytest tests for core/loader.py"""
 
+import os
+
 import pytest
 from core.loader import TranslationFileLoader
 
@@ -50,3 +52,48 @@ class TestTranslationFileLoader:
         """Test handling of non-existent directory."""
         with pytest.raises(FileNotFoundError):
             TranslationFileLoader("/nonexistent/path")
+
+    def test_prefers_top_level_file(self, temp_translations):
+        """Test a top-level locale file wins over nested duplicates."""
+        nested = temp_translations / "locales"
+        nested.mkdir()
+        (nested / "en.json").write_text('{"nested": "yes"}')
+        (nested / "fr.json").write_text('{"auth": {"login": "Connexion"}}')
+
+        loader = TranslationFileLoader(temp_translations)
+        locale_files = loader.load()
+
+        assert locale_files["en"].path == temp_translations / "en.json"
+        assert locale_files["fr"].path == nested / "fr.json"
+        assert locale_files["fr"].data["auth"]["login"] == "Connexion"
+
+    def test_skips_ignored_directories(self, temp_translations):
+        """Test locale files inside ignored directories are not discovered."""
+        ignored = temp_translations / "node_modules" / "pkg"
+        ignored.mkdir(parents=True)
+        (ignored / "fr.json").write_text('{"key": "value"}')
+
+        loader = TranslationFileLoader(temp_translations)
+        assert loader.discover_locales() == ["de", "en"]
+
+    def test_load_single_nested_and_missing(self, temp_translations):
+        """Test loading a single locale from a nested folder or not at all."""
+        nested = temp_translations / "locales"
+        nested.mkdir()
+        (nested / "fr.json").write_text('{"auth": {"login": "Connexion"}}')
+
+        loader = TranslationFileLoader(temp_translations)
+        assert loader.load_single("fr") == {"auth": {"login": "Connexion"}}
+        assert loader.load_single("es") is None
+
+    def test_cache_invalidated_by_older_mtime(self, temp_translations):
+        """Test a rewritten file is reparsed even if its mtime went backwards."""
+        en_path = temp_translations / "en.json"
+        loader = TranslationFileLoader(temp_translations)
+        loader.load()
+
+        stat = en_path.stat()
+        en_path.write_text('{"restored": "from backup"}')
+        os.utime(en_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+
+        assert loader.load_single("en") == {"restored": "from backup"}
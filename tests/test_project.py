@@ -1,6 +1,10 @@
 """Pytest tests for core/project.py"""
 
+import json
+import os
+
 import pytest
+from core.analyzer import TranslationGapAnalyzer
 from core.project import TranslationProject
 
 
@@ -57,7 +61,7 @@ class TestTranslationProject:
         # auth.logout is missing in de
         assert "auth.logout" in gaps
         gap = gaps["auth.logout"]
-        assert gap.missing_in == ["de"]
+        assert gap.missing_in == ("de",)
 
     def test_get_coverage(self, temp_translations):
         """Test coverage calculation."""
@@ -91,8 +95,6 @@ class TestTranslationProject:
         assert success is True
 
         # Verify changes were written
-        import json
-
         with open(temp_translations / "de.json", "r") as f:
             saved_data = json.load(f)
 
@@ -118,3 +120,348 @@ class TestTranslationProject:
         # Value should be reset
         value = project.get_key_value("de", "auth.logout")
         assert value is None
+
+    def test_gaps_cached_until_mutation(self, temp_translations):
+        """Test gap results are reused and refreshed after edits."""
+        project = TranslationProject(temp_translations)
+        project.load()
+
+        gaps = project.get_gaps()
+        assert project.get_gaps() is gaps
+        assert "auth.logout" in gaps
+
+        project.set_key_value("de", "auth.logout", "Abmelden")
+        assert "auth.logout" not in project.get_gaps()
+        assert project.get_coverage()["de"] == 100.0
+
+        project.discard_key_changes("auth.logout")
+        assert "auth.logout" in project.get_gaps()
+
+    def test_get_all_keys_sorted(self, temp_translations):
+        """Test sorted key list is cached and tracks new keys."""
+        project = TranslationProject(temp_translations)
+        project.load()
+
+        keys = project.get_all_keys_sorted()
+        assert keys == ("auth.login", "auth.logout", "dashboard.welcome")
+        assert project.get_all_keys_sorted() is keys
+
+        project.set_key_value("en", "auth.login", "Log In")
+        assert project.get_all_keys_sorted() is keys
+
+        project.set_key_value("en", "about.title", "About")
+        assert project.get_all_keys_sorted()[0] == "about.title"
+
+        # Filling a gap keeps the tuple; deleting a key splices it out
+        keys = project.get_all_keys_sorted()
+        project.set_key_value("de", "auth.logout", "Abmelden")
+        assert project.get_all_keys_sorted() is keys
+        project.delete_key_value("en", "about.title")
+        assert project.get_all_keys_sorted() == (
+            "auth.login",
+            "auth.logout",
+            "dashboard.welcome",
+        )
+
+    def test_get_categorized_keys(self, temp_translations):
+        """Test keys are grouped by category and regrouped when keys change."""
+        project = TranslationProject(temp_translations)
+        project.load()
+
+        top_level, categories = project.get_categorized_keys()
+        assert top_level == ()
+        assert dict(categories) == {
+            "auth": ("auth.login", "auth.logout"),
+            "dashboard": ("dashboard.welcome",),
+        }
+
+        project.set_key_value("en", "title", "App")
+        project.set_key_value("en", "about.title", "About")
+        top_level, categories = project.get_categorized_keys()
+        assert top_level == ("title",)
+        assert list(categories) == ["about", "auth", "dashboard"]
+
+    def test_delete_updates_gaps_and_keys(self, temp_translations):
+        """Test deleting values keeps gaps and key list in sync."""
+        project = TranslationProject(temp_translations)
+        project.load()
+
+        project.delete_key_value("de", "auth.login")
+        assert project.get_gaps()["auth.login"].missing_in == ("de",)
+
+        project.delete_key_value("en", "auth.logout")
+        assert "auth.logout" not in project.get_all_keys()
+        assert "auth.logout" not in project.get_gaps()
+
+    def test_reload_reuses_unchanged_locales(self, temp_translations):
+        """Test reload only re-flattens locales that changed."""
+        project = TranslationProject(temp_translations)
+        project.load()
+        en_flat = project.flattened["en"]
+        de_flat = project.flattened["de"]
+
+        project.set_key_value("de", "auth.logout", "Abmelden")
+        project.reload()
+
+        assert project.flattened["en"] is en_flat
+        assert project.flattened["de"] is not de_flat
+        assert project.get_key_value("de", "auth.logout") is None
+
+    def test_reload_sees_rewrite_with_same_mtime(self, temp_translations):
+        """Test reload re-flattens a file rewritten with its old mtime kept."""
+        project = TranslationProject(temp_translations)
+        project.load()
+        de_path = temp_translations / "de.json"
+        stat = de_path.stat()
+
+        de_path.write_text('{"auth": {"login": "Einloggen"}, "extra": "Neu"}')
+        os.utime(de_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        project.reload()
+
+        assert project.get_key_value("de", "auth.login") == "Einloggen"
+        assert project.get_key_value("de", "extra") == "Neu"
+        assert project.get_key_value("de", "dashboard.welcome") is None
+
+    def test_save_bookkeeping_waits_for_finish(self, temp_translations):
+        """Test writing pending data leaves project state alone until finish_save."""
+        project = TranslationProject(temp_translations)
+        project.load()
+        project.set_key_value("de", "auth.logout", "Abmelden")
+
+        pending = project.prepare_save()
+        results = project.write_pending(pending)
+        assert project.get_changed_keys() == {"auth.logout"}
+
+        assert project.finish_save(pending, results) is True
+        assert project.has_unsaved_changes() is False
+        assert "Abmelden" in (temp_translations / "de.json").read_text()
+
+    def test_edits_during_save_stay_pending(self, temp_translations):
+        """Test edits made after prepare_save are neither written nor marked saved."""
+        project = TranslationProject(temp_translations)
+        project.load()
+        project.set_key_value("de", "auth.logout", "Abmelden")
+
+        pending = project.prepare_save()
+        project.set_key_value("de", "auth.logout", "Ausloggen")
+        project.set_key_value("de", "extra", "Neu")
+        assert project.finish_save(pending, project.write_pending(pending)) is True
+
+        written = (temp_translations / "de.json").read_text()
+        assert "Abmelden" in written
+        assert "Ausloggen" not in written and "extra" not in written
+        assert project.get_changed_keys() == {"auth.logout", "extra"}
+        assert project.get_unsaved_locales() == ["de"]
+
+        assert project.save() is True
+        assert project.has_unsaved_changes() is False
+        assert "Ausloggen" in (temp_translations / "de.json").read_text()
+
+    def test_reload_locale(self, temp_translations):
+        """Test reloading a single locale from disk."""
+        project = TranslationProject(temp_translations)
+        project.load()
+        project.set_key_value("en", "auth.login", "Temp")
+        project.set_key_value("de", "auth.logout", "Abmelden")
+
+        (temp_translations / "de.json").write_text(
+            json.dumps({"auth": {"login": "Anmelden", "logout": "Abmelden"}})
+        )
+        assert project.reload_locale("de") is True
+
+        assert project.get_key_value("de", "auth.logout") == "Abmelden"
+        assert "dashboard.welcome" in project.get_gaps()
+        assert project.get_unsaved_locales() == ["en"]
+        assert project.get_key_value("en", "auth.login") == "Temp"
+
+    def test_discard_key_changes_tracks_locales(self, temp_translations):
+        """Test a locale stays unsaved while it has other pending changes."""
+        project = TranslationProject(temp_translations)
+        project.load()
+
+        project.set_key_value("de", "auth.logout", "Abmelden")
+        project.set_key_value("de", "auth.logout", "Ausloggen")
+        project.set_key_value("de", "dashboard.welcome", "Hallo")
+        project.set_key_value("en", "auth.logout", "Log Out")
+
+        assert project.discard_key_changes("auth.logout") is True
+        assert project.get_unsaved_locales() == ["de"]
+
+        assert project.discard_key_changes("dashboard.welcome") is True
+        assert project.has_unsaved_changes() is False
+
+    def test_get_complete_keys(self, temp_translations):
+        """Test complete keys follow additions and deletions."""
+        project = TranslationProject(temp_translations)
+        project.load()
+        assert project.get_complete_keys() == {"auth.login", "dashboard.welcome"}
+
+        project.set_key_value("de", "auth.logout", "Abmelden")
+        assert "auth.logout" in project.get_complete_keys()
+
+        project.delete_key_value("en", "auth.login")
+        assert "auth.login" not in project.get_complete_keys()
+
+    def test_edits_keep_nested_data_in_sync(self, temp_translations):
+        """Test set/delete update the nested data that save writes."""
+        project = TranslationProject(temp_translations)
+        project.load()
+
+        project.set_key_value("de", "auth.logout", "Abmelden")
+        project.delete_key_value("de", "dashboard.welcome")
+        assert project.locale_files["de"].data == {
+            "auth": {"login": "Anmelden", "logout": "Abmelden"}
+        }
+
+        assert project.save() is True
+        with open(temp_translations / "de.json", "r") as f:
+            assert json.load(f) == {"auth": {"login": "Anmelden", "logout": "Abmelden"}}
+
+    def test_save_with_literal_dotted_key(self, temp_translations):
+        """Test keys stored with a literal dot are rebuilt on save."""
+        (temp_translations / "fr.json").write_text(json.dumps({"auth.login": "Old"}))
+        project = TranslationProject(temp_translations)
+        project.load()
+
+        project.set_key_value("fr", "auth.login", "Connexion")
+        assert project.save() is True
+
+        with open(temp_translations / "fr.json", "r") as f:
+            assert json.load(f) == {"auth": {"login": "Connexion"}}
+
+    def test_literal_dotted_key_edit_leaves_nested_data(self, temp_translations):
+        """Test an edit that cannot be mirrored adds no empty parents."""
+        (temp_translations / "fr.json").write_text('{"x.y": "Old"}')
+        project = TranslationProject(temp_translations)
+        project.load()
+
+        project.set_key_value("fr", "x.y", "New")
+
+        assert project.locale_files["fr"].data == {"x.y": "Old"}
+        assert project.get_key_value("fr", "x.y") == "New"
+
+    def test_version_bumps_on_edits(self, temp_translations):
+        """Test the version changes on edits and reloads but not on reads."""
+        project = TranslationProject(temp_translations)
+        project.load()
+        version = project.version
+
+        project.get_gaps()
+        project.get_all_keys_sorted()
+        assert project.version == version
+
+        project.set_key_value("en", "auth.login", "Log In")
+        assert project.version > version
+        version = project.version
+
+        project.delete_key_value("de", "auth.login")
+        assert project.version > version
+        version = project.version
+
+        project.save()
+        assert project.version > version
+        version = project.version
+
+        project.reload()
+        assert project.version > version
+
+    def test_batch_bumps_version_once(self, temp_translations):
+        """Test edits inside batch() bump the version once on exit."""
+        project = TranslationProject(temp_translations)
+        project.load()
+        version = project.version
+
+        with project.batch():
+            project.set_key_value("en", "auth.login", "Log In")
+            project.set_key_value("de", "auth.logout", "Abmelden")
+            assert project.version == version
+            # Analysis stays current inside the batch
+            assert "auth.logout" not in project.get_gaps()
+
+        assert project.version == version + 1
+
+    def test_missing_by_locale_tracks_edits(self, temp_translations):
+        """Test per-locale missing keys stay in sync with gaps."""
+        project = TranslationProject(temp_translations)
+        project.load()
+
+        def from_gaps():
+            expected = {locale: set() for locale in project.get_locales()}
+            for key, gap in project.get_gaps().items():
+                for locale in gap.missing_in:
+                    expected[locale].add(key)
+            return expected
+
+        assert project.get_missing_by_locale() == from_gaps()
+
+        project.set_key_value("en", "new.key", "New")
+        assert project.get_missing_by_locale() == from_gaps()
+        assert "new.key" in project.get_missing_by_locale()["de"]
+
+        project.delete_key_value("en", "auth.login")
+        assert project.get_missing_by_locale() == from_gaps()
+
+        project.delete_key_value("en", "new.key")
+        assert project.get_missing_by_locale() == from_gaps()
+        assert all("new.key" not in m for m in project.get_missing_by_locale().values())
+
+    def test_coverage_tracks_edits(self, temp_translations):
+        """Test incremental coverage matches a full recount after edits."""
+        project = TranslationProject(temp_translations)
+        project.load()
+
+        def recount():
+            return TranslationGapAnalyzer.get_coverage_percentage(project.flattened)
+
+        assert project.get_coverage() == recount()
+
+        project.set_key_value("de", "auth.logout", "Abmelden")
+        assert project.get_coverage() == recount()
+
+        project.set_key_value("en", "new.key", "New")
+        project.delete_key_value("de", "auth.login")
+        assert project.get_coverage() == recount()
+
+    def test_gaps_update_per_key(self, temp_translations):
+        """Test gaps match a full analysis and unchanged gaps are reused."""
+        project = TranslationProject(temp_translations)
+        project.load()
+        logout_gap = project.get_gaps()["auth.logout"]
+
+        project.set_key_value("en", "new.key", "New")
+        project.delete_key_value("de", "auth.login")
+        gaps = project.get_gaps()
+        assert gaps == TranslationGapAnalyzer.analyze(project.flattened)
+        assert gaps["auth.logout"] is logout_gap
+        assert hash(logout_gap) == hash(
+            TranslationGapAnalyzer.analyze(project.flattened)["auth.logout"]
+        )
+
+        project.set_key_value("de", "auth.logout", "Abmelden")
+        assert "auth.logout" not in project.get_gaps()
+
+    def test_noop_edits_leave_locale_clean(self, temp_translations):
+        """Test unchanged values and absent deletes do not mark locales dirty."""
+        project = TranslationProject(temp_translations)
+        project.load()
+
+        project.set_key_value("en", "auth.login", "Sign In")
+        project.delete_key_value("en", "does.not.exist")
+
+        assert project.has_unsaved_changes() is False
+        assert project.get_changed_keys() == set()
+
+    def test_changed_keys_follow_changes(self, temp_translations):
+        """Test cached changed keys stay current across edit, discard and save."""
+        project = TranslationProject(temp_translations)
+        project.load()
+
+        project.set_key_value("en", "auth.login", "Log In")
+        project.set_key_value("de", "auth.logout", "Raus")
+        assert project.get_changed_keys() == {"auth.login", "auth.logout"}
+
+        project.discard_key_changes("auth.login")
+        assert project.get_changed_keys() == {"auth.logout"}
+
+        project.save()
+        assert project.get_changed_keys() == set()
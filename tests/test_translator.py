@@ -0,0 +1,81 @@
+"""Pytest tests for core/translator.py"""
+
+import pytest
+
+import core.translator
+from core.translator import Translator
+
+
+class FakeGoogleTranslator:
+    """Stand-in for deep_translator.GoogleTranslator that upper-cases text."""
+
+    requests = []
+
+    def __init__(self, source, target):
+        self.source = source
+        self.target = target
+
+    def translate(self, text):
+        FakeGoogleTranslator.requests.append(text)
+        return text.upper()
+
+
+@pytest.fixture
+def fake_google(monkeypatch):
+    """Route translation requests through FakeGoogleTranslator."""
+    monkeypatch.setattr(core.translator, "GoogleTranslator", FakeGoogleTranslator)
+    monkeypatch.setattr(core.translator, "_translators", {})
+    core.translator._translate_cached.cache_clear()
+    FakeGoogleTranslator.requests = []
+    yield FakeGoogleTranslator
+    core.translator._translate_cached.cache_clear()
+
+
+class TestTranslateBatch:
+    """Test Translator.translate_batch."""
+
+    def test_texts_sent_in_one_request(self, fake_google):
+        """Test that texts are joined, translated once and split in order."""
+        result = Translator().translate_batch(["one", "two", "three"], "en", "de")
+
+        assert result == ["ONE", "TWO", "THREE"]
+        assert len(fake_google.requests) == 1
+
+    def test_whitespace_inside_texts_kept(self, fake_google):
+        """Test that only the separator's own newlines are removed."""
+        result = Translator().translate_batch([" padded ", "two\nlines"], "en", "de")
+
+        assert result == [" PADDED ", "TWO\nLINES"]
+
+    def test_reordered_markers_fall_back(self, fake_google, monkeypatch):
+        """Test that out-of-order markers fall back to one request per text."""
+
+        def swap_markers(self, text):
+            fake_google.requests.append(text)
+            return text.upper().replace("[[0]]", "[[x]]").replace("[[1]]", "[[0]]")
+
+        monkeypatch.setattr(FakeGoogleTranslator, "translate", swap_markers)
+        result = Translator().translate_batch(["one", "two"], "en", "de")
+
+        assert result == ["ONE", "TWO"]
+        assert fake_google.requests[1:] == ["one", "two"]
+
+    def test_dropped_marker_falls_back(self, fake_google, monkeypatch):
+        """Test that a lost marker is detected instead of misaligning results."""
+
+        def drop_marker(self, text):
+            fake_google.requests.append(text)
+            return text.upper().replace("[[1]]\n", "")
+
+        monkeypatch.setattr(FakeGoogleTranslator, "translate", drop_marker)
+        result = Translator().translate_batch(["one", "two", "three"], "en", "de")
+
+        assert result == ["ONE", "TWO", "THREE"]
+        assert len(fake_google.requests) == 4
+
+    def test_text_with_marker_sent_alone(self, fake_google):
+        """Test that a text that looks like a marker is not batched."""
+        result = Translator().translate_batch(["one", "see [[2]]", "two"], "en", "de")
+
+        assert result == ["ONE", "SEE [[2]]", "TWO"]
+        assert "see [[2]]" in fake_google.requests
@@ -94,3 +94,26 @@ class TestTranslationWriter:
         assert "  " in content  # 2-space indent
         # Should have trailing newline
         assert content.endswith("\n")
+
+    def test_write_atomic_keeps_permissions(self, temp_dir, writer):
+        """Test atomic writes keep the mode and leave no temp files."""
+        file_path = temp_dir / "perm.json"
+        file_path.write_text("{}")
+        file_path.chmod(0o644)
+
+        assert writer.write_atomic({"key": "value"}, file_path) is True
+
+        assert file_path.stat().st_mode & 0o777 == 0o644
+        assert [p.name for p in temp_dir.iterdir()] == ["perm.json"]
+
+    def test_write_many(self, temp_dir, writer):
+        """Test writing several files at once reports each result."""
+        items = {
+            temp_dir / f"{loc}.json": {"greeting": loc} for loc in ("en", "de", "fr")
+        }
+
+        results = writer.write_many(items)
+
+        assert results == {path: True for path in items}
+        for path, data in items.items():
+            assert json.loads(path.read_text()) == data
@@ -90,6 +90,9 @@ class LazyI18nApp(App):
     }
     """
 
+    # Seconds of typing pause before the search filter is applied
+    SEARCH_DELAY = 0.08
+
     BINDINGS = [
         ("s", "save", "Save"),
         ("q", "quit", "Quit"),
@@ -116,6 +119,9 @@ class LazyI18nApp(App):
         self.status_pane = None
         self.search_buffer = ""
         self.is_searching = False
+        self._search_timer = None
+        # Set while a save or reload runs in the background; edits wait
+        self.is_busy = False
         self.show_staged = False
         self.show_missing = False
 
@@ -212,25 +218,24 @@ class LazyI18nApp(App):
 
     @on(Tree.NodeSelected)
     def on_tree_select(self, event: Tree.NodeSelected) -> None:
-        """Handle tree selection."""
-        if event.node.data:
-            self.values_pane.selected_key = event.node.data
-            # Force refresh to ensure right pane updates immediately
-            self.values_pane.refresh()
+        """Handle tree selection (Enter or click), e.g. on a rebuilt node."""
+        self._show_tree_node(event.control, event.node)
+        self.values_pane.refresh()
 
     @on(Tree.NodeHighlighted)
     def on_tree_highlight(self, event: Tree.NodeHighlighted) -> None:
         """Update values pane when the highlighted node changes via navigation."""
-        tree = event.control
-        key = event.node.data
+        self._show_tree_node(event.control, event.node)
+
+    def _show_tree_node(self, tree: Tree, node) -> None:
+        """Show a tree node's key in the values pane and style the cursor."""
+        key = node.data
 
         # Reset classes
         tree.remove_class("status-error", "status-warning")
 
         if key:
             self.values_pane.selected_key = key
-            # Force refresh to ensure right pane updates during navigation
-            self.values_pane.refresh()
 
             # Update tree cursor style based on key status
             gaps = self.project.get_gaps()
@@ -243,13 +248,33 @@ class LazyI18nApp(App):
 
     @on(Input.Changed, "#search-input")
     def on_search_changed(self, event: Input.Changed) -> None:
-        """Handle search input changes."""
+        """Handle search input changes, filtering once typing pauses."""
         self.search_buffer = event.value
+        self._schedule_search()
+
+    def _schedule_search(self) -> None:
+        """Apply the filters once input pauses, replacing any pending update."""
+        self._cancel_search_timer()
+        self._search_timer = self.set_timer(self.SEARCH_DELAY, self._apply_search)
+
+    def _apply_search(self) -> None:
+        """Filter the tree by the current search buffer and toggles."""
+        self._search_timer = None
         self.tree_pane.rebuild(self.search_buffer, self.show_staged, self.show_missing)
 
+    def _cancel_search_timer(self) -> None:
+        """Drop a pending search filter update."""
+        if self._search_timer:
+            self._search_timer.stop()
+            self._search_timer = None
+
     @on(Input.Submitted, "#search-input")
     def on_search_submitted(self, event: Input.Submitted) -> None:
         """Handle search submission."""
+        # Apply a filter still waiting on the typing pause
+        if self._search_timer:
+            self._cancel_search_timer()
+            self._apply_search()
         self.is_searching = False
         self.status_pane.search_input.display = False
         self.status_pane.status_display.display = True
@@ -262,7 +287,8 @@ class LazyI18nApp(App):
         if self.is_searching:
             return
         self.show_staged = not self.show_staged
-        self.tree_pane.rebuild(self.search_buffer, self.show_staged, self.show_missing)
+        # Rapid toggles share the search debounce, so only the last applies
+        self._schedule_search()
         self.status_pane.update_filters(self.show_staged, self.show_missing)
 
     def action_toggle_missing(self) -> None:
@@ -270,7 +296,7 @@ class LazyI18nApp(App):
         if self.is_searching:
             return
         self.show_missing = not self.show_missing
-        self.tree_pane.rebuild(self.search_buffer, self.show_staged, self.show_missing)
+        self._schedule_search()
         self.status_pane.update_filters(self.show_staged, self.show_missing)
 
     def action_search(self) -> None:
@@ -284,11 +310,12 @@ class LazyI18nApp(App):
     def action_cancel_search(self) -> None:
         """Cancel search mode."""
         if self.is_searching:
+            self._cancel_search_timer()
             self.is_searching = False
             self.search_buffer = ""
             self.status_pane.search_input.display = False
             self.status_pane.status_display.display = True
-            self.tree_pane.clear_filter()
+            self.tree_pane.clear_filter(self.show_staged, self.show_missing)
             self.set_focus(self.tree_pane)
 
     def action_edit(self) -> None:
@@ -298,24 +325,24 @@ class LazyI18nApp(App):
 
         # If we are on a branch node (no data), toggle expansion
         # We need to access the tree widget directly
-        if self.tree_pane and hasattr(self.tree_pane, "_tree"):
+        if self.tree_pane and self.tree_pane._tree:
             node = self.tree_pane._tree.cursor_node
             if node and node.allow_expand:
                 node.toggle()
                 return
 
-        if self.values_pane.selected_key:
+        if self.values_pane.selected_key and not self.is_busy:
             self.push_screen(EditScreen(self.project, self.values_pane.selected_key))
 
     def action_new_key(self) -> None:
         """Create a new translation key."""
-        if self.is_searching:
+        if self.is_searching or self.is_busy:
             return
         self.push_screen(NewKeyScreen(self.project))
 
     def action_delete_key(self) -> None:
         """Delete the selected key or discard changes with confirmation."""
-        if self.is_searching:
+        if self.is_searching or self.is_busy:
             return
 
         key = self.values_pane.selected_key
@@ -332,7 +359,7 @@ class LazyI18nApp(App):
 
     def action_translate_key(self) -> None:
         """Translate the selected key for all missing locales."""
-        if self.is_searching:
+        if self.is_searching or self.is_busy:
             return
 
         if not self.values_pane.selected_key:
@@ -354,8 +381,9 @@ class LazyI18nApp(App):
                 return
 
             # Apply translations (stages them, doesn't save)
-            for locale, text in translations.items():
-                self.project.set_key_value(locale, key, text)
+            with self.project.batch():
+                for locale, text in translations.items():
+                    self.project.set_key_value(locale, key, text)
 
             count = len(translations)
             self.status_pane.action = (
@@ -364,8 +392,8 @@ class LazyI18nApp(App):
             self.status_pane.update_status()
 
             # Refresh UI
-            self.tree_pane.rebuild(
-                self.search_buffer, self.show_staged, self.show_missing
+            self.tree_pane.update_key(
+                key, self.search_buffer, self.show_staged, self.show_missing
             )
             self.values_pane.refresh()
 
@@ -375,7 +403,7 @@ class LazyI18nApp(App):
 
     def action_llm_translate(self) -> None:
         """Translate the selected key using LLM."""
-        if self.is_searching:
+        if self.is_searching or self.is_busy:
             return
 
         if not self.values_pane.selected_key:
@@ -429,6 +457,7 @@ class LazyI18nApp(App):
                 api_key=api_key,
                 base_url=config.get("openai.base_url"),
                 model=config.get("openai.model", "gpt-3.5-turbo"),
+                cache_dir=self.project.directory / ".lazyi18n" / "cache",
             )
         except Exception as e:
             self.status_pane.action = f"[$warning]✗[/] LLM Init failed: {e}"
@@ -436,6 +465,8 @@ class LazyI18nApp(App):
             return
 
         def do_translate():
+            if self.is_busy:
+                return
             # Create and push progress screen
             progress_screen = LLMProgressScreen()
             self.push_screen(progress_screen)
@@ -527,8 +558,9 @@ class LazyI18nApp(App):
             return
 
         # Apply translations
-        for locale, text in translations.items():
-            self.project.set_key_value(locale, key, text)
+        with self.project.batch():
+            for locale, text in translations.items():
+                self.project.set_key_value(locale, key, text)
 
         count = len(translations)
         progress_screen.write_log(
@@ -542,12 +574,14 @@ class LazyI18nApp(App):
         self.status_pane.update_status()
 
         # Refresh UI
-        self.tree_pane.rebuild(self.search_buffer, self.show_staged, self.show_missing)
+        self.tree_pane.update_key(
+            key, self.search_buffer, self.show_staged, self.show_missing
+        )
         self.values_pane.refresh()
 
     def action_translate_all_missing(self) -> None:
         """Translate all missing keys across all locales."""
-        if self.is_searching:
+        if self.is_searching or self.is_busy:
             return
 
         gaps = self.project.get_gaps()
@@ -585,8 +619,9 @@ class LazyI18nApp(App):
             return
 
         # Apply translations (stages them, doesn't save)
-        for (locale, key), text in translations.items():
-            self.project.set_key_value(locale, key, text)
+        with self.project.batch():
+            for (locale, key), text in translations.items():
+                self.project.set_key_value(locale, key, text)
 
         count = len(translations)
         self.status_pane.action = f"[$success][/] Translated {count} missing keys"
@@ -598,7 +633,7 @@ class LazyI18nApp(App):
 
     def action_quit(self) -> None:
         """Quit the application."""
-        if self.is_searching:
+        if self.is_searching or self.is_busy:
             return
 
         if self.project.has_unsaved_changes():
@@ -607,36 +642,76 @@ class LazyI18nApp(App):
             self.exit()
 
     def action_save(self) -> None:
-        """Save changes to disk and refresh UI."""
-        if self.is_searching:
+        """Save changes to disk in the background."""
+        if self.is_searching or self.is_busy:
             return
-        if self.project.save():
-            self.status_pane.action = f"[$success][/] Saved to disk"
-            self.status_pane.update_status()
-            # Rebuild tree to clear pencil indicators since everything is now saved
-            self.tree_pane.rebuild(
-                self.search_buffer, self.show_staged, self.show_missing
-            )
-            # Refresh values pane
-            self.values_pane.refresh()
+        self.is_busy = True
+        self.status_pane.action = "[$warning]⏳[/] Saving..."
+        # Only leaves of keys with pending changes lose their pencil
+        dirty_keys = self.project.get_changed_keys()
+        # The worker only writes files; project state is updated back on
+        # this thread, so search and filters never see it half-changed
+        pending = self.project.prepare_save()
+        self.run_worker(lambda: self._save_worker(pending, dirty_keys), thread=True)
+
+    def _save_worker(self, pending, dirty_keys) -> None:
+        """Background worker writing the pending locale files."""
+        try:
+            results = self.project.write_pending(pending)
+        except Exception:
+            results = {}
+        self.call_from_thread(self._on_save_complete, pending, results, dirty_keys)
+
+    def _on_save_complete(self, pending, results, dirty_keys) -> None:
+        """Record the save and refresh the UI once the files were written."""
+        self.is_busy = False
+        if self.project.finish_save(pending, results):
+            # Repaint status, tree and values in a single frame
+            with self.batch_update():
+                self.status_pane.action = f"[$success][/] Saved to disk"
+                self.status_pane.update_status()
+                # Clear pencil indicators on the keys that were just saved
+                self.tree_pane.update_keys(
+                    dirty_keys, self.search_buffer, self.show_staged, self.show_missing
+                )
+                # Refresh values pane
+                self.values_pane.refresh()
         else:
             self.status_pane.action = f"[$error][/] Save failed"
 
     def perform_reload(self) -> None:
-        """Execute the reload operation."""
-        if self.project.reload():
-            self.status_pane.action = f"[$success][/] Reloaded"
-            self.status_pane.update_status()
-            self.tree_pane.rebuild(
-                self.search_buffer, self.show_staged, self.show_missing
-            )
-            self.values_pane.selected_key = ""
+        """Reload from disk in the background."""
+        if self.is_busy:
+            return
+        self.is_busy = True
+        self.status_pane.action = "[$warning]⏳[/] Reloading..."
+        self.run_worker(self._reload_worker, thread=True)
+
+    def _reload_worker(self) -> None:
+        """Background worker reading and parsing the locale files."""
+        try:
+            locale_files = self.project.loader.load()
+        except Exception:
+            locale_files = None
+        self.call_from_thread(self._on_reload_complete, locale_files)
+
+    def _on_reload_complete(self, locale_files) -> None:
+        """Take over the reloaded files and refresh the UI."""
+        self.is_busy = False
+        if locale_files is not None and self.project.apply_reload(locale_files):
+            with self.batch_update():
+                self.status_pane.action = f"[$success][/] Reloaded"
+                self.status_pane.update_status()
+                self.tree_pane.rebuild(
+                    self.search_buffer, self.show_staged, self.show_missing
+                )
+                self.values_pane.selected_key = ""
         else:
             self.status_pane.action = f"[$error][/] Reload failed"
 
     def action_reload(self) -> None:
         """Reload from disk."""
-        if self.is_searching:
+        if self.is_searching or self.is_busy:
             return
 
         if self.project.has_unsaved_changes():
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from textual.app import ComposeResult
 from textual.containers import Container
 from textual.reactive import reactive
@@ -6,6 +8,16 @@ from textual.binding import Binding
 
 from core.project import TranslationProject
 
+# Nerd Font icons used in tree labels
+_UNSAVED_ICON = ""
+_GAP_ICON = ""
+_OK_ICON = ""
+_FOLDER_ICON = ""
+
+# Coverage bars in the status summary, indexed by the number of filled cells
+_BAR_WIDTH = 20
+_BARS = tuple("█" * i + "░" * (_BAR_WIDTH - i) for i in range(_BAR_WIDTH + 1))
+
 
 class TranslationTree(Tree):
     """Custom Tree widget to handle keybindings."""
@@ -25,7 +37,30 @@ class TreePane(Static):
         self.project = project
         self._tree = None
         self.search_term = ""
+        # Filters the tree was last built with
+        self._filters = ("", False, False)
         self.border_title = "Keys"
+        # (keys, gap keys, top-level keys, categories, gap categories); the
+        # grouping follows the project's key set, the gap parts its gaps
+        self._cache = None
+        self._gap_source = None
+        self._leaf_names = {}
+        # Lowercased search text and search term -> matching keys, both
+        # valid for the same project.version since they cover values too
+        self._search_groups = None
+        self._search_version = -1
+        self._filter_cache = {}
+        # Nodes currently in the tree with the status their label shows, so
+        # rebuilds only touch what changed
+        self._leaves = {}
+        self._leaf_status = {}
+        self._category_nodes = {}
+        self._category_status = {}
+        self._label_theme = None
+        # (prefix, suffix) around leaf text per (unsaved, gap, top level),
+        # plus category prefixes; they embed theme colours
+        self._leaf_affixes = {}
+        self._category_prefixes = ("", "")
 
     def compose(self) -> ComposeResult:
         """Compose the tree pane."""
@@ -34,108 +69,263 @@ class TreePane(Static):
         self._build_tree()
         yield self._tree
 
+    def _cache_stale(self) -> bool:
+        """Whether keys or gaps changed since _grouped_keys last ran."""
+        # The project hands out the same objects until keys (or a key's
+        # presence in some locale) change, so value edits keep the cache
+        return (
+            self._cache is None
+            or self._cache[0] is not self.project.get_all_keys_sorted()
+            or self._gap_source is not self.project.get_gaps()
+        )
+
+    def _grouped_keys(self) -> tuple:
+        """Return keys, gaps and their grouping, rebuilt only when they change."""
+        if not self._cache_stale():
+            return self._cache
+
+        keys = self.project.get_all_keys_sorted()
+        if self._cache is None or self._cache[0] is not keys:
+            top_level_keys, categories = self.project.get_categorized_keys()
+            # Key -> text shown on its leaf (the part after the category)
+            leaf_names = dict(zip(top_level_keys, top_level_keys))
+            for category, category_keys in categories.items():
+                start = len(category) + 1
+                for key in category_keys:
+                    leaf_names[key] = key[start:]
+            self._leaf_names = leaf_names
+            self._search_groups = None
+        else:
+            _, _, top_level_keys, categories, _ = self._cache
+
+        # Keys with gaps, snapshotted once per gap analysis
+        self._gap_source = self.project.get_gaps()
+        gaps = frozenset(self._gap_source)
+        self._cache = (
+            keys,
+            gaps,
+            top_level_keys,
+            categories,
+            # Categories with a gap when nothing is filtered out
+            frozenset(
+                category
+                for category, category_keys in categories.items()
+                if not gaps.isdisjoint(category_keys)
+            ),
+        )
+        return self._cache
+
+    def _search_index(self) -> list:
+        """
+        Return lowercased search text per key, grouped like the tree.
+        Each group carries the joined text of all its keys so a search can
+        skip groups that cannot match without looking at their keys.
+        """
+        _, _, top_level_keys, categories, _ = self._grouped_keys()
+        if self._search_groups is None or self._search_version != self.project.version:
+            locales = self.project.get_locales()
+            groups = []
+            for group_keys in (top_level_keys, *categories.values()):
+                entries = []
+                for key in group_keys:
+                    # Key name plus every non-empty value; NUL keeps a term
+                    # from matching across two of them
+                    parts = [key.lower()]
+                    for locale in locales:
+                        val = self.project.get_key_value(locale, key)
+                        if val:
+                            parts.append(str(val).lower())
+                    entries.append((key, "\0".join(parts)))
+                blob = "\0".join(text for _, text in entries)
+                groups.append((blob, entries))
+            self._search_groups = groups
+            self._search_version = self.project.version
+            self._filter_cache = {}
+        return self._search_groups
+
+    def _matching_keys(self, term: str) -> set:
+        """Return keys whose name or any value contains the search term."""
+        groups = self._search_index()
+        matched = self._filter_cache.get(term)
+        if matched is not None:
+            return matched
+
+        matched = set()
+        for blob, entries in groups:
+            if term in blob:
+                matched.update(key for key, text in entries if term in text)
+
+        if len(self._filter_cache) >= 32:
+            self._filter_cache.clear()
+        self._filter_cache[term] = matched
+        return matched
+
+    def _visible_keys(
+        self,
+        gaps,
+        changed_keys,
+        filter_term: str,
+        show_staged: bool,
+        show_missing: bool,
+    ):
+        """Return the set of keys passing the filters, or None for all keys."""
+        visible = None
+
+        # Filter keys by search term
+        if filter_term:
+            visible = self._matching_keys(filter_term.lower())
+
+        # Filter by staged/missing
+        if show_staged or show_missing:
+            flagged = set()
+            if show_staged:
+                flagged.update(changed_keys)
+            if show_missing:
+                flagged.update(gaps)
+            visible = flagged if visible is None else visible & flagged
+
+        return visible
+
+    def _set_label_theme(self, theme) -> None:
+        """Precompute the label markup around key and category names."""
+        warning, error, success = theme.warning, theme.error, theme.success
+        for top_level in (True, False):
+            spacer = "  " if top_level else " "
+            unsaved = (
+                f"[{warning}]{_UNSAVED_ICON}[/]{spacer}[bold {warning}]",
+                "[/]",
+            )
+            gap = (f"[{error}]{_GAP_ICON}[/]{spacer}[bold {error}]", "[/]")
+            ok = (f"[{success}]{_OK_ICON}[/] ", "")
+            self._leaf_affixes[True, True, top_level] = unsaved
+            self._leaf_affixes[True, False, top_level] = unsaved
+            self._leaf_affixes[False, True, top_level] = gap
+            self._leaf_affixes[False, False, top_level] = ok
+        folder = f"[{theme.secondary}]{_FOLDER_ICON}[/] "
+        self._category_prefixes = (folder, f"[{error}]{_GAP_ICON}[/] {folder}")
+
+    def _leaf_label(self, key: str, status: tuple, top_level: bool) -> str:
+        """Label a key leaf with its (unsaved, gap) status."""
+        prefix, suffix = self._leaf_affixes[(*status, top_level)]
+        return prefix + self._leaf_names[key] + suffix
+
+    def _category_label(self, category: str, has_gap: bool) -> str:
+        """Label a category, with a warning if any shown child has gaps."""
+        return self._category_prefixes[has_gap] + category
+
+    @staticmethod
+    def _position(after) -> dict:
+        """Insert after the given sibling, or first when there is none."""
+        return {"after": after} if after is not None else {"before": 0}
+
+    def _sync_leaf(
+        self,
+        parent,
+        key: str,
+        top_level: bool,
+        previous,
+        gaps,
+        changed_keys,
+        unsaved_locales,
+    ):
+        """Add the leaf for a shown key, or relabel it if its status changed."""
+        status = (key in changed_keys and bool(unsaved_locales), key in gaps)
+        node = self._leaves.get(key)
+        if node is None:
+            label = self._leaf_label(key, status, top_level)
+            node = parent.add_leaf(label, data=key, **self._position(previous))
+            self._leaves[key] = node
+        elif self._leaf_status.get(key) != status:
+            node.set_label(self._leaf_label(key, status, top_level))
+        self._leaf_status[key] = status
+        return node
+
     def _build_tree(
         self,
         filter_term: str = "",
         show_staged: bool = False,
         show_missing: bool = False,
     ) -> None:
-        """Build the tree from translation keys."""
+        """
+        Bring the tree in line with the project and filters. Only nodes that
+        appear, disappear or change status are touched; the rest (including
+        their expansion state) are kept.
+        """
         if not self._tree:
             return
 
         root = self._tree.root
         root.data = None
-        gaps = self.project.get_gaps()
-        keys = self.project.get_all_keys()
+        _, gaps, top_level_keys, categories, gap_categories = self._grouped_keys()
         unsaved_locales = self.project.get_unsaved_locales()
         changed_keys = self.project.get_changed_keys()
+        visible = self._visible_keys(
+            gaps, changed_keys, filter_term, show_staged, show_missing
+        )
 
-        # Filter keys by search term
-        if filter_term:
-            term = filter_term.lower()
-            filtered_keys = []
-            for key in keys:
-                # Check key match
-                if term in key.lower():
-                    filtered_keys.append(key)
-                    continue
-
-                # Check value match in any locale
-                for locale in self.project.get_locales():
-                    val = self.project.get_key_value(locale, key)
-                    if val and term in str(val).lower():
-                        filtered_keys.append(key)
-                        break
-            keys = filtered_keys
-
-        # Filter by staged/missing
-        if show_staged or show_missing:
-            filtered_keys = []
-            for key in keys:
-                is_staged = key in changed_keys
-                is_missing = key in gaps
-
-                if show_staged and show_missing:
-                    if is_staged or is_missing:
-                        filtered_keys.append(key)
-                elif show_staged and is_staged:
-                    filtered_keys.append(key)
-                elif show_missing and is_missing:
-                    filtered_keys.append(key)
-            keys = filtered_keys
-
-        # Group by category (first part before dot) and identify top-level keys
-        categories = {}
-        top_level_keys = []  # Keys without dots
-
-        for key in keys:
-            if "." in key:
-                parts = key.split(".")
-                category = parts[0]
-                if category not in categories:
-                    categories[category] = []
-                categories[category].append(key)
-            else:
-                top_level_keys.append(key)
-
-        # Add top-level keys directly to root
-        for key in sorted(top_level_keys):
-            has_gap = key in gaps
-            has_unsaved = key in changed_keys and unsaved_locales
-
-            # Mark with status: unsaved, gap, or complete
-            if has_unsaved:
-                label = f"[{self.app.current_theme.warning}][/]  [bold {self.app.current_theme.warning}]{key}[/]"
-            elif has_gap:
-                label = f"[{self.app.current_theme.error}][/]  [bold {self.app.current_theme.error}]{key}[/]"
-            else:
-                label = f"[{self.app.current_theme.success}][/] {key}"
-            root.add_leaf(label, data=key)
+        # Labels embed theme colours, so a theme switch relabels everything
+        theme = self.app.current_theme
+        if theme.name != self._label_theme:
+            self._label_theme = theme.name
+            self._set_label_theme(theme)
+            self._leaf_status.clear()
+            self._category_status.clear()
+
+        shown_keys = set()
+        shown_categories = set()
+
+        # Top-level keys come first under the root, in key order
+        previous = None
+        for key in top_level_keys:
+            if visible is None or key in visible:
+                previous = self._sync_leaf(
+                    root, key, True, previous, gaps, changed_keys, unsaved_locales
+                )
+                shown_keys.add(key)
 
         # Build tree with category warnings if any child has gaps
-        for category in sorted(categories.keys()):
-            category_keys = categories[category]
-            category_has_gap = any(k in gaps for k in category_keys)
-            cat_label = f"[{self.app.current_theme.secondary}][/] {category}"
-            if category_has_gap:
-                cat_label = f"[{self.app.current_theme.error}][/] {cat_label}"
-            cat_node = root.add(cat_label)
-            cat_node.expand()
-            for key in sorted(categories[category]):
-                label = key.split(".", 1)[1] if "." in key else key
-                has_gap = key in gaps
-                # Show pencil if this key has unsaved changes
-                has_unsaved = key in changed_keys and unsaved_locales
-
-                # Mark with status: unsaved, gap, or complete
-                if has_unsaved:
-                    label = f"[{self.app.current_theme.warning}][/] [bold {self.app.current_theme.warning}]{label}[/]"
-                elif has_gap:
-                    label = f"[{self.app.current_theme.error}][/] [bold {self.app.current_theme.error}]{label}[/]"
-                else:
-                    label = f"[{self.app.current_theme.success}][/] {label}"
-                cat_node.add_leaf(label, data=key)
+        for category, category_keys in categories.items():
+            if visible is None:
+                has_gap = category in gap_categories
+            else:
+                category_keys = [k for k in category_keys if k in visible]
+                if not category_keys:
+                    continue
+                has_gap = not gaps.isdisjoint(category_keys)
+            cat_node = self._category_nodes.get(category)
+            if cat_node is None:
+                cat_node = root.add(
+                    self._category_label(category, has_gap),
+                    **self._position(previous),
+                )
+                cat_node.expand()
+                self._category_nodes[category] = cat_node
+            elif self._category_status.get(category) != has_gap:
+                cat_node.set_label(self._category_label(category, has_gap))
+            self._category_status[category] = has_gap
+            shown_categories.add(category)
+            previous = cat_node
+
+            child = None
+            for key in category_keys:
+                child = self._sync_leaf(
+                    cat_node, key, False, child, gaps, changed_keys, unsaved_locales
+                )
+                shown_keys.add(key)
+
+        # Drop nodes that are filtered out or whose keys no longer exist;
+        # leaves of a dropped category go with it
+        dropped = set()
+        for category in self._category_nodes.keys() - shown_categories:
+            dropped.add(self._category_nodes.pop(category))
+            self._category_status.pop(category, None)
+        for key in self._leaves.keys() - shown_keys:
+            node = self._leaves.pop(key)
+            self._leaf_status.pop(key, None)
+            if node.parent not in dropped:
+                node.remove()
+        for cat_node in dropped:
+            cat_node.remove()
 
     def rebuild(
         self,
@@ -143,23 +333,77 @@ class TreePane(Static):
         show_staged: bool = False,
         show_missing: bool = False,
     ) -> None:
-        """Rebuild the tree."""
+        """Rebuild the tree, updating only the nodes that changed."""
         self.search_term = filter_term
+        self._filters = (filter_term, show_staged, show_missing)
         if self._tree:
-            self._tree.clear()
             self._tree.root.expand()
             self._build_tree(filter_term, show_staged, show_missing)
 
-    def clear_filter(self) -> None:
-        """Clear search filter."""
-        self.search_term = ""
-        self.rebuild("")
+    def update_key(
+        self,
+        key: str,
+        filter_term: str = "",
+        show_staged: bool = False,
+        show_missing: bool = False,
+    ) -> None:
+        """Refresh the tree after edits to a single key."""
+        self.update_keys((key,), filter_term, show_staged, show_missing)
+
+    def update_keys(
+        self,
+        keys,
+        filter_term: str = "",
+        show_staged: bool = False,
+        show_missing: bool = False,
+    ) -> None:
+        """
+        Refresh the tree after edits to the given keys. When the key set and
+        filters cannot have changed what is shown, only those keys' leaves
+        are relabelled; otherwise this falls back to rebuild().
+        """
+        if not self._tree:
+            return
+        if (
+            # An edit can move a key in or out of any active filter
+            self._filters != ("", False, False)
+            or (filter_term, show_staged, show_missing) != self._filters
+            # New keys or gaps can add leaves or flip category markers
+            or self._cache_stale()
+            or self.app.current_theme.name != self._label_theme
+            or any(key not in self._leaves for key in keys)
+        ):
+            self.rebuild(filter_term, show_staged, show_missing)
+            return
+
+        gaps = self._cache[1]
+        changed_keys = self.project.get_changed_keys()
+        unsaved_locales = self.project.get_unsaved_locales()
+        root = self._tree.root
+        for key in keys:
+            parent = self._leaves[key].parent
+            self._sync_leaf(
+                parent,
+                key,
+                parent is root,
+                None,
+                gaps,
+                changed_keys,
+                unsaved_locales,
+            )
+
+    def clear_filter(
+        self, show_staged: bool = False, show_missing: bool = False
+    ) -> None:
+        """Clear search filter, keeping the edited/missing filters."""
+        self.rebuild("", show_staged, show_missing)
 
 
 class ValuesPane(Static):
     """Right pane showing translation values."""
 
-    selected_key: reactive[str] = reactive("", recompose=True)
+    # Static renders its own text, so a repaint is enough on change
+    selected_key: reactive[str] = reactive("")
 
     def __init__(self, project: TranslationProject):
         super().__init__()
@@ -167,10 +411,19 @@ class ValuesPane(Static):
         self.preview_key = ""
         self.preview_values = {}
         self.border_title = "Translations"
+        # Rendered text per (key, preview, project.version)
+        self._render_cached = lru_cache(maxsize=256)(self._render_uncached)
 
     def render(self) -> str:
         """Render values for selected key."""
-        if not self.selected_key:
+        preview = ()
+        if self.selected_key and self.preview_key == self.selected_key:
+            preview = tuple(sorted(self.preview_values.items()))
+        return self._render_cached(self.selected_key, preview, self.project.version)
+
+    def _render_uncached(self, selected_key: str, preview: tuple, version: int) -> str:
+        """Build the text for a key, preferring the given preview values."""
+        if not selected_key:
             return (
                 f"[$primary] #                           ###   #    #####         \n"
                 " #         ##   ###### #   #  #   ##   #     # #    # \n"
@@ -189,19 +442,20 @@ class ValuesPane(Static):
         gaps = self.project.get_gaps()
         changed_keys = self.project.get_changed_keys()
 
-        if self.selected_key in gaps:
+        if selected_key in gaps:
             header_color = "$error"
-        elif self.selected_key in changed_keys:
+        elif selected_key in changed_keys:
             header_color = "$warning"
 
-        lines = [f"[bold {header_color} reverse] {self.selected_key} [/]\n"]
+        lines = [f"[bold {header_color} reverse] {selected_key} [/]\n"]
+        preview_values = dict(preview)
 
         for locale in self.project.get_locales():
             # Prefer preview values when editing this key
-            if self.preview_key == self.selected_key and locale in self.preview_values:
-                value = self.preview_values.get(locale) or ""
+            if locale in preview_values:
+                value = preview_values[locale] or ""
             else:
-                value = self.project.get_key_value(locale, self.selected_key)
+                value = self.project.get_key_value(locale, selected_key)
             if value:
                 lines.append(f"[$success] {locale}[/]: {value}")
             else:
@@ -233,9 +487,20 @@ class StatusDisplay(Static):
     def __init__(self, project: TranslationProject):
         super().__init__()
         self.project = project
+        # Overview and locale health lines for project.version, and the
+        # unsaved changes lines; both dropped by invalidate()
+        self._summary_lines = None
+        self._summary_version = -1
+        self._unsaved_lines = None
+
+    def invalidate(self) -> None:
+        """Drop cached status text and redraw."""
+        self._summary_lines = None
+        self._unsaved_lines = None
+        self.refresh()
 
-    def render(self) -> str:
-        """Render comprehensive status info."""
+    def _summary(self) -> list:
+        """Build the overview and locale health lines."""
         coverage = self.project.get_coverage()
         gaps = self.project.get_gaps()
         all_keys = self.project.get_all_keys()
@@ -246,10 +511,10 @@ class StatusDisplay(Static):
         fully_translated = total_keys - len(gaps)
 
         # Calculate missing per locale
-        missing_per_locale = {loc: 0 for loc in locales}
-        for gap in gaps.values():
-            for loc in gap.missing_in:
-                missing_per_locale[loc] += 1
+        missing_per_locale = {
+            loc: len(missing)
+            for loc, missing in self.project.get_missing_by_locale().items()
+        }
 
         lines = []
 
@@ -276,15 +541,34 @@ class StatusDisplay(Static):
                     "$success" if pct == 100 else "$warning" if pct >= 80 else "$error"
                 )
 
-                # Progress bar (20 chars wide)
-                bar_width = 20
-                filled = int(pct / 100 * bar_width)
-                bar = "█" * filled + "░" * (bar_width - filled)
+                bar = _BARS[min(_BAR_WIDTH, int(pct / 100 * _BAR_WIDTH))]
 
                 lines.append(
                     f"  {locale:<5} [{color}]{bar}[/] {pct:>5.1f}%  ([dim]{present}/{total_keys}[/])"
                 )
         lines.append("")
+        return lines
+
+    def _unsaved_summary(self) -> list:
+        """Build the unsaved changes lines."""
+        lines = []
+        changed_keys = self.project.get_changed_keys()
+        if changed_keys:
+            lines.append(
+                f"  [$warning]●[/] Unsaved Changes: [$warning]{len(changed_keys)}[/] keys modified"
+            )
+            lines.append(f"      Locales: {', '.join(self.unsaved)}")
+        else:
+            lines.append(f"  [$success]●[/] All changes saved")
+        return lines
+
+    def render(self) -> str:
+        """Render comprehensive status info."""
+        if self._summary_lines is None or self._summary_version != self.project.version:
+            self._summary_lines = self._summary()
+            self._summary_version = self.project.version
+            self._unsaved_lines = None
+        lines = list(self._summary_lines)
 
         # Active Filters
         if self.show_staged or self.show_missing:
@@ -300,14 +584,9 @@ class StatusDisplay(Static):
         lines.append("[bold]System[/]")
 
         # Unsaved changes
-        changed_keys = self.project.get_changed_keys()
-        if changed_keys:
-            lines.append(
-                f"  [$warning]●[/] Unsaved Changes: [$warning]{len(changed_keys)}[/] keys modified"
-            )
-            lines.append(f"      Locales: {', '.join(self.unsaved)}")
-        else:
-            lines.append(f"  [$success]●[/] All changes saved")
+        if self._unsaved_lines is None:
+            self._unsaved_lines = self._unsaved_summary()
+        lines.extend(self._unsaved_lines)
         # Last Action
         if self.action != "Ready":
             lines.append(f"  [$secondary]ℹ[/] {self.action}")
@@ -321,6 +600,7 @@ class StatusDisplay(Static):
     def update_status(self) -> None:
         """Update status from project."""
         self.unsaved = self.project.get_unsaved_locales()
+        self.invalidate()
 
 
 class StatusPane(Container):
@@ -1,3 +1,6 @@
+import re
+import time
+
 from textual.app import ComposeResult
 from textual.containers import VerticalScroll
 from textual.screen import Screen
@@ -5,6 +8,13 @@ from textual.widgets import Input, Label, LoadingIndicator, RichLog
 
 from core.project import TranslationProject
 
+# Locale rows composed up front in edit dialogs; the rest are mounted after
+# the dialog has been drawn once
+INITIAL_LOCALE_ROWS = 12
+
+# Valid translation keys: letters, numbers, dots, hyphens and underscores
+_KEY_RE = re.compile(r"[\w.-]+")
+
 
 class LoadingScreen(Screen):
     """Screen shown while loading translations."""
@@ -90,7 +100,34 @@ class HelpScreen(Screen):
         self.app.pop_screen()
 
 
-class EditScreen(Screen):
+class LocaleModalScreen(Screen):
+    """Base for dialogs with one input row per locale."""
+
+    # Rules shared by every locale dialog, parsed once for the base class
+    DEFAULT_CSS = """
+    LocaleModalScreen {
+        align: center middle;
+    }
+
+    LocaleModalScreen .locale-label {
+        margin-top: 1;
+        color: $text-muted;
+    }
+
+    LocaleModalScreen Input {
+        margin-bottom: 1;
+    }
+
+    LocaleModalScreen .dialog-help {
+        dock: bottom;
+        text-align: center;
+        color: $text-muted;
+        margin-top: 1;
+    }
+    """
+
+
+class EditScreen(LocaleModalScreen):
     """Modal screen for editing translation values."""
 
     BINDINGS = [
@@ -98,11 +135,12 @@ class EditScreen(Screen):
         ("ctrl+s", "save", "Save"),
     ]
 
+    # Seconds to wait after the last keystroke before updating the preview,
+    # and the pause after which a keystroke updates it immediately
+    PREVIEW_DELAY = 0.12
+    PREVIEW_IDLE = 0.5
+
     CSS = """
-    EditScreen {
-        align: center middle;
-    }
-    
     #edit-dialog {
         width: 80;
         height: auto;
@@ -119,21 +157,6 @@ class EditScreen(Screen):
         margin-bottom: 1;
     }
     
-    .locale-label {
-        margin-top: 1;
-        color: $text-muted;
-    }
-    
-    Input {
-        margin-bottom: 1;
-    }
-    
-    #edit-help {
-        dock: bottom;
-        text-align: center;
-        color: $text-muted;
-        margin-top: 1;
-    }
     """
 
     def __init__(self, project: TranslationProject, key: str):
@@ -142,74 +165,130 @@ class EditScreen(Screen):
         self.key = key
         self.inputs = {}
         self.input_order = []
+        # Input -> position in input_order, for Enter-to-next
+        self._order_index = {}
+        self._input_to_locale = {}
+        # Stripped input values, updated one locale per keystroke
+        self._current_values = {}
+        self._preview_timer = None
+        self._last_flush = 0.0
+        self._deferred_locales = []
+        self.help_label = None
 
     def compose(self) -> ComposeResult:
         """Compose the edit dialog."""
         with VerticalScroll(id="edit-dialog"):
             yield Label(f"Edit: {self.key}", id="edit-title")
 
-            for locale in self.project.get_locales():
-                yield Label(f"{locale}:", classes="locale-label")
-                current_value = self.project.get_key_value(locale, self.key) or ""
-                input_widget = Input(
-                    value=current_value, placeholder=f"Enter {locale} translation..."
-                )
-                # Track inputs by locale via self.inputs dict
-                self.inputs[locale] = input_widget
-                self.input_order.append(input_widget)
-                yield input_widget
+            locales = self.project.get_locales()
+            self._deferred_locales = locales[INITIAL_LOCALE_ROWS:]
+            for locale in locales[:INITIAL_LOCALE_ROWS]:
+                yield from self._locale_row(locale)
 
-            yield Label(
+            self.help_label = Label(
                 "[Esc] Cancel | [Ctrl+S] Save | [Tab/Enter] Next field | Empty value = delete",
                 id="edit-help",
+                classes="dialog-help",
             )
+            yield self.help_label
+
+    def _locale_row(self, locale: str) -> tuple:
+        """Create the label and input for one locale."""
+        current_value = self.project.get_key_value(locale, self.key) or ""
+        input_widget = Input(
+            value=current_value, placeholder=f"Enter {locale} translation..."
+        )
+        # Track inputs by locale via self.inputs dict
+        self.inputs[locale] = input_widget
+        self._order_index[input_widget] = len(self.input_order)
+        self.input_order.append(input_widget)
+        self._input_to_locale[input_widget] = locale
+        self._current_values[locale] = current_value.strip()
+        return Label(f"{locale}:", classes="locale-label"), input_widget
+
+    def _mount_deferred_rows(self) -> None:
+        """Mount the locale rows left out of the first draw."""
+        widgets = [
+            w for locale in self._deferred_locales for w in self._locale_row(locale)
+        ]
+        self._deferred_locales = []
+        self.query_one("#edit-dialog").mount_all(widgets, before=self.help_label)
 
     def on_mount(self) -> None:
         """Focus the first input on open."""
         if self.input_order:
             self.set_focus(self.input_order[0])
+        if self._deferred_locales:
+            self.call_after_refresh(self._mount_deferred_rows)
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Update the live preview, debounced while typing."""
+        locale = self._input_to_locale.get(event.input)
+        if locale is None:
+            return
+        self._current_values[locale] = event.value.strip()
+
+        if self._preview_timer:
+            self._preview_timer.stop()
+            self._preview_timer = None
+
+        # Render the first keystroke after a pause immediately, then only
+        # once typing settles
+        if time.monotonic() - self._last_flush > self.PREVIEW_IDLE:
+            self._flush_preview()
+        else:
+            self._preview_timer = self.set_timer(
+                self.PREVIEW_DELAY, self._flush_preview
+            )
+
+    def _flush_preview(self) -> None:
+        """Push the current input values to the values pane."""
+        self._preview_timer = None
+        self._last_flush = time.monotonic()
+        if self.app.values_pane is not None:
+            self.app.values_pane.set_preview(self.key, self._current_values)
 
     def on_key(self, event) -> None:
         """Handle Enter to move to the next field without clearing text."""
         if event.key == "enter" and self.input_order:
-            try:
-                current = self.focused
-                idx = (
-                    self.input_order.index(current)
-                    if current in self.input_order
-                    else -1
-                )
-                next_idx = (idx + 1) % len(self.input_order)
-                self.set_focus(self.input_order[next_idx])
-                event.stop()
-                return
-            except ValueError:
-                pass
+            idx = self._order_index.get(self.focused, -1)
+            next_idx = (idx + 1) % len(self.input_order)
+            self.set_focus(self.input_order[next_idx])
+            event.stop()
 
     def action_save(self) -> None:
         """Save all changes to memory and close."""
+        if self.app.is_busy:
+            self.app.notify("Save or reload in progress", severity="warning")
+            return
+        if self._preview_timer:
+            self._preview_timer.stop()
         # Read current values from inputs
-        for locale, input_widget in self.inputs.items():
-            # Get the text from the Input widget
-            new_value = input_widget.value.strip() if input_widget.value else ""
-
-            if new_value:
-                self.project.set_key_value(locale, self.key, new_value)
-            else:
-                # Empty field deletes the translation for that locale
-                self.project.delete_key_value(locale, self.key)
+        with self.project.batch():
+            for locale, input_widget in self.inputs.items():
+                # Get the text from the Input widget
+                new_value = input_widget.value.strip() if input_widget.value else ""
+
+                if new_value:
+                    self.project.set_key_value(locale, self.key, new_value)
+                else:
+                    # Empty field deletes the translation for that locale
+                    self.project.delete_key_value(locale, self.key)
 
         # Update the values pane and tree immediately
-        if hasattr(self.app, "values_pane") and self.app.values_pane:
+        if self.app.values_pane is not None:
             self.app.values_pane.clear_preview()
             self.app.values_pane.refresh()
 
-        if hasattr(self.app, "tree_pane") and self.app.tree_pane:
-            self.app.tree_pane.rebuild(
-                self.app.search_buffer, self.app.show_staged, self.app.show_missing
+        if self.app.tree_pane is not None:
+            self.app.tree_pane.update_key(
+                self.key,
+                self.app.search_buffer,
+                self.app.show_staged,
+                self.app.show_missing,
             )
 
-        if hasattr(self.app, "status_pane") and self.app.status_pane:
+        if self.app.status_pane is not None:
             self.app.status_pane.update_status()
 
         # Close the modal
@@ -217,13 +296,15 @@ class EditScreen(Screen):
 
     def action_cancel(self) -> None:
         """Cancel editing and close."""
+        if self._preview_timer:
+            self._preview_timer.stop()
         # Clear any live preview
-        if hasattr(self.app, "values_pane") and self.app.values_pane:
+        if self.app.values_pane is not None:
             self.app.values_pane.clear_preview()
         self.app.pop_screen()
 
 
-class NewKeyScreen(Screen):
+class NewKeyScreen(LocaleModalScreen):
     """Modal screen for creating new translation keys."""
 
     BINDINGS = [
@@ -232,10 +313,6 @@ class NewKeyScreen(Screen):
     ]
 
     CSS = """
-    NewKeyScreen {
-        align: center middle;
-    }
-    
     #new-key-dialog {
         width: 80;
         height: auto;
@@ -261,22 +338,6 @@ class NewKeyScreen(Screen):
         margin-bottom: 2;
     }
     
-    .locale-label {
-        margin-top: 1;
-        color: $text-muted;
-    }
-    
-    Input {
-        margin-bottom: 1;
-    }
-    
-    #new-key-help {
-        dock: bottom;
-        text-align: center;
-        color: $text-muted;
-        margin-top: 1;
-    }
-    
     #error-message {
         color: $error;
         text-align: center;
@@ -291,6 +352,7 @@ class NewKeyScreen(Screen):
         self.key_input = None
         self.inputs = {}
         self.error_label = None
+        self._deferred_locales = []
 
     def compose(self) -> ComposeResult:
         """Compose the new key dialog."""
@@ -305,20 +367,35 @@ class NewKeyScreen(Screen):
             )
             yield self.key_input
 
-            for locale in self.project.get_locales():
-                yield Label(f"{locale}:", classes="locale-label")
-                input_widget = Input(placeholder=f"Enter {locale} translation...")
-                # Track inputs by locale via self.inputs dict
-                self.inputs[locale] = input_widget
-                yield input_widget
+            locales = self.project.get_locales()
+            self._deferred_locales = locales[INITIAL_LOCALE_ROWS:]
+            for locale in locales[:INITIAL_LOCALE_ROWS]:
+                yield from self._locale_row(locale)
 
             self.error_label = Label("", id="error-message")
             yield self.error_label
 
             yield Label(
-                "[Esc] Cancel | [Ctrl+S] Create | [Tab] Next field", id="new-key-help"
+                "[Esc] Cancel | [Ctrl+S] Create | [Tab] Next field",
+                id="new-key-help",
+                classes="dialog-help",
             )
 
+    def _locale_row(self, locale: str) -> tuple:
+        """Create the label and input for one locale."""
+        input_widget = Input(placeholder=f"Enter {locale} translation...")
+        # Track inputs by locale via self.inputs dict
+        self.inputs[locale] = input_widget
+        return Label(f"{locale}:", classes="locale-label"), input_widget
+
+    def _mount_deferred_rows(self) -> None:
+        """Mount the locale rows left out of the first draw."""
+        widgets = [
+            w for locale in self._deferred_locales for w in self._locale_row(locale)
+        ]
+        self._deferred_locales = []
+        self.query_one("#new-key-dialog").mount_all(widgets, before=self.error_label)
+
     def on_mount(self) -> None:
         """Focus key input on mount."""
         if self.initial_key and self.inputs:
@@ -327,9 +404,14 @@ class NewKeyScreen(Screen):
             self.set_focus(first_input)
         else:
             self.set_focus(self.key_input)
+        if self._deferred_locales:
+            self.call_after_refresh(self._mount_deferred_rows)
 
     def action_create(self) -> None:
         """Create the new key."""
+        if self.app.is_busy:
+            self.app.notify("Save or reload in progress", severity="warning")
+            return
         key = self.key_input.value.strip()
 
         # Validate key
@@ -337,7 +419,7 @@ class NewKeyScreen(Screen):
             self.error_label.update(f"[$error][/] Key cannot be empty")
             return
 
-        if not all(c.isalnum() or c in "._-" for c in key):
+        if not _KEY_RE.fullmatch(key):
             self.error_label.update(
                 f"[$error][/] Key can only contain letters, numbers, dots, hyphens, and underscores"
             )
@@ -350,11 +432,12 @@ class NewKeyScreen(Screen):
 
         # Collect values
         has_value = False
-        for locale, input_widget in self.inputs.items():
-            new_value = input_widget.value.strip()
-            if new_value:
-                has_value = True
-                self.project.set_key_value(locale, key, new_value)
+        with self.project.batch():
+            for locale, input_widget in self.inputs.items():
+                new_value = input_widget.value.strip()
+                if new_value:
+                    has_value = True
+                    self.project.set_key_value(locale, key, new_value)
 
         if not has_value:
             self.error_label.update(
@@ -363,11 +446,11 @@ class NewKeyScreen(Screen):
             return
 
         # Notify main app to rebuild tree
-        if hasattr(self.app, "tree_pane"):
+        if self.app.tree_pane is not None:
             self.app.tree_pane.rebuild(
                 self.app.search_buffer, self.app.show_staged, self.app.show_missing
             )
-        if hasattr(self.app, "status_pane"):
+        if self.app.status_pane is not None:
             self.app.status_pane.action = f"[$success][/] Created key: {key}"
 
         self.app.pop_screen()
@@ -591,18 +674,22 @@ class DeleteConfirmScreen(Screen):
 
     def action_confirm(self) -> None:
         """Confirm and delete the key from all locales."""
+        if self.app.is_busy:
+            self.app.notify("Save or reload in progress", severity="warning")
+            return
         # Delete the key from all locales
-        for locale in self.project.get_locales():
-            self.project.delete_key_value(locale, self.key)
+        with self.project.batch():
+            for locale in self.project.get_locales():
+                self.project.delete_key_value(locale, self.key)
 
         # Update the main app
-        if hasattr(self.app, "tree_pane"):
+        if self.app.tree_pane is not None:
             self.app.tree_pane.rebuild(
                 self.app.search_buffer, self.app.show_staged, self.app.show_missing
             )
-        if hasattr(self.app, "values_pane"):
+        if self.app.values_pane is not None:
             self.app.values_pane.selected_key = ""
-        if hasattr(self.app, "status_pane"):
+        if self.app.status_pane is not None:
             self.app.status_pane.action = f"[$success][/] Deleted key: {self.key}"
             self.app.status_pane.update_status()
 
@@ -681,17 +768,23 @@ class DiscardConfirmScreen(Screen):
 
     def action_confirm(self) -> None:
         """Confirm and discard changes."""
+        if self.app.is_busy:
+            self.app.notify("Save or reload in progress", severity="warning")
+            return
         self.project.discard_key_changes(self.key)
 
-        # Notify main app to rebuild tree
-        if hasattr(self.app, "tree_pane"):
-            self.app.tree_pane.rebuild(
-                self.app.search_buffer, self.app.show_staged, self.app.show_missing
+        # Notify main app to refresh the key in the tree
+        if self.app.tree_pane is not None:
+            self.app.tree_pane.update_key(
+                self.key,
+                self.app.search_buffer,
+                self.app.show_staged,
+                self.app.show_missing,
             )
-        if hasattr(self.app, "values_pane"):
+        if self.app.values_pane is not None:
             self.app.values_pane.refresh()
 
-        if hasattr(self.app, "status_pane"):
+        if self.app.status_pane is not None:
             self.app.status_pane.action = (
                 f"[$success][/] Discarded changes for: {self.key}"
             )